@@ -15,3 +15,15 @@ MODEL_CODE_REVIEWER = MODEL_ID_CLAUDE_SONNET_37
 MODEL_UI_DESIGNER = MODEL_ID_NOVA_PREMIER
 MODEL_UI_TESTER = MODEL_ID_NOVA_PREMIER
 MODEL_MINOR_TASK = MODEL_ID_NOVA_MICRO
+
+# Models that support Bedrock latency-optimized inference
+MODEL_ID_CLAUDE_HAIKU_35 = 'us.anthropic.claude-3-5-haiku-20241022-v1:0'
+MODEL_ID_LLAMA_31_70B = 'us.meta.llama3-1-70b-instruct-v1:0'
+MODEL_ID_LLAMA_31_405B = 'us.meta.llama3-1-405b-instruct-v1:0'
+
+LATENCY_OPTIMIZED_MODELS = frozenset({
+    MODEL_ID_CLAUDE_HAIKU_35,
+    MODEL_ID_LLAMA_31_70B,
+    MODEL_ID_LLAMA_31_405B,
+    MODEL_ID_NOVA_PRO,
+})
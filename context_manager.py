@@ -3,98 +3,189 @@ Context Manager for Token Optimization
 Provides complexity-based context loading to reduce token usage.
 """
 
+import logging
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple, Union
 
+logger = logging.getLogger(__name__)
 
-def get_condensed_context(agent_type: str, complexity_level: str = "SIMPLE") -> str:
-    """
-    Get context based on project complexity to minimize token usage.
-    
-    Args:
-        agent_type: Type of agent (business_analyst, developer, etc.)
-        complexity_level: SIMPLE, MODERATE, or COMPLEX
-        
-    Returns:
-        Optimized context string
-    """
-    
-    # Condensed contexts for SIMPLE projects (10-15 lines vs 100+ lines)
-    simple_contexts = {
-        "business_analyst": """# BUSINESS ANALYST AGENT
+# Providers only cache prompt prefixes of at least this many tokens
+MIN_CACHEABLE_TOKENS = 1024
+
+# Folder holding the full agent contexts used for COMPLEX projects
+_CONTEXT_DIR = Path(__file__).parent / "context"
+
+# Condensed contexts for SIMPLE projects (10-15 lines vs 100+ lines).
+# Each agent context is split into a stable prefix (role header + core rules)
+# and a suffix (agent notes + output format). Complexity-specific text is only
+# ever inserted between the two, so the prefix stays byte-for-byte identical
+# across SIMPLE/MODERATE prompts and can be reused by provider prompt caching.
+_SIMPLE_CONTEXTS: Mapping[str, Tuple[str, str]] = {
+    "business_analyst": (
+        """# BUSINESS ANALYST AGENT
 You analyze requirements and assess complexity. Create business analysis files in staging/business_analyst/.
 
 ## Core Rules
 1. Assess complexity first (SIMPLE/MODERATE/COMPLEX)
 2. Create proportional documentation - SIMPLE projects need minimal docs
 3. Focus on essential requirements only
-4. Generate user stories and functional specs
-5. For risk assessment: ONLY focus on technical risks in implemented solution, not requirements/operational/management risks
+4. Generate user stories and functional specs""",
+        """## Risk Assessment
+ONLY focus on technical risks in implemented solution, not requirements/operational/management risks
 
 ## Output: JSON with status, summary, generated_files, recommendations, downstream_inputs
-Files: complexity_assessment.md, functional_specification.md, user_stories.md (for SIMPLE)""",
+Files: complexity_assessment.md, functional_specification.md, user_stories.md (for SIMPLE)"""
+    ),
 
-        "software_architect": """# SOFTWARE ARCHITECT AGENT
+    "software_architect": (
+        """# SOFTWARE ARCHITECT AGENT
 You design system architecture. Create architecture files in staging/software_architect/.
 
 ## Core Rules
 1. Design based on complexity level from Business Analyst
 2. SIMPLE projects: basic architecture only
 3. Focus on essential technical decisions
-4. Create implementation guidelines
-
-## Output: JSON with status, summary, generated_files, recommendations, downstream_inputs
-Files: technical_specification.md, system_architecture.md (for SIMPLE)""",
+4. Create implementation guidelines""",
+        """## Output: JSON with status, summary, generated_files, recommendations, downstream_inputs
+Files: technical_specification.md, system_architecture.md (for SIMPLE)"""
+    ),
 
-        "ui_designer": """# UI/UX DESIGNER AGENT
+    "ui_designer": (
+        """# UI/UX DESIGNER AGENT
 You create UI/UX designs. Create design files in staging/ui_designer/.
 
 ## Core Rules
 1. Design based on complexity level
 2. SIMPLE projects: basic wireframes and components
 3. Focus on essential user experience
-4. Ensure accessibility compliance
-
-## Output: JSON with status, summary, generated_files, recommendations, downstream_inputs
-Files: wireframes.md, design_system.md (for SIMPLE)""",
+4. Ensure accessibility compliance""",
+        """## Output: JSON with status, summary, generated_files, recommendations, downstream_inputs
+Files: wireframes.md, design_system.md (for SIMPLE)"""
+    ),
 
-        "developer": """# DEVELOPER AGENT
+    "developer": (
+        """# DEVELOPER AGENT
 You implement code based on specifications. Create code files in staging/developer/.
 
 ## Core Rules
 1. Follow specifications from architect
 2. SIMPLE projects: essential implementation only
 3. Write clean, working code
-4. Include basic tests
+4. Include basic tests""",
+        """## Output: JSON with status, summary, generated_files, recommendations, downstream_inputs
+Files: source_code/, README.md, tests/ (for SIMPLE)"""
+    ),
 
-## Output: JSON with status, summary, generated_files, recommendations, downstream_inputs
-Files: source_code/, README.md, tests/ (for SIMPLE)""",
-
-        "ui_tester": """# UI TESTER AGENT
+    "ui_tester": (
+        """# UI TESTER AGENT
 You test UI functionality. Create test files in staging/ui_tester/.
 
 ## Core Rules
 1. Test based on complexity level
 2. SIMPLE projects: essential functional tests
 3. Focus on core user workflows
-4. Generate test scripts
+4. Generate test scripts""",
+        """## Output: JSON with status, summary, generated_files, recommendations, downstream_inputs
+Files: test_plan.md, functional_tests.py (for SIMPLE)"""
+    ),
 
-## Output: JSON with status, summary, generated_files, recommendations, downstream_inputs
-Files: test_plan.md, functional_tests.py (for SIMPLE)""",
-
-        "code_reviewer": """# CODE REVIEWER AGENT
+    "code_reviewer": (
+        """# CODE REVIEWER AGENT
 You review code quality. Create review files in staging/code_reviewer/.
 
 ## Core Rules
 1. Review based on complexity level
 2. SIMPLE projects: essential quality checks
 3. Focus on functionality and basic best practices
-4. Provide actionable feedback
-
-## Output: JSON with status, summary, generated_files, recommendations, downstream_inputs
+4. Provide actionable feedback""",
+        """## Output: JSON with status, summary, generated_files, recommendations, downstream_inputs
 Files: code_review_report.md, quality_metrics.md (for SIMPLE)"""
-    }
+    ),
+}
+
+# Extra guidance inserted between prefix and suffix for MODERATE projects
+_MODERATE_GUIDELINES = """## Additional Guidelines for MODERATE projects:
+- Include more detailed documentation
+- Add extra validation steps
+- Consider additional edge cases"""
+
+
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+
+
+def _canonicalize(text: str) -> str:
+    """
+    Normalize whitespace so logically identical prompts are byte-identical.
+
+    Line endings become LF, trailing whitespace is stripped from each line,
+    runs of blank lines collapse to one, and the text ends with a single newline.
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = "\n".join(line.rstrip() for line in text.split("\n"))
+    text = _EXCESS_NEWLINES_RE.sub("\n\n", text)
+    return text.rstrip("\n") + "\n"
+
+
+def _get_context_parts(agent_type: str) -> Tuple[str, str]:
+    """Get the (prefix, suffix) pair for an agent, defaulting to business analyst."""
+    return _SIMPLE_CONTEXTS.get(agent_type, _SIMPLE_CONTEXTS["business_analyst"])
+
+
+@lru_cache(maxsize=64)
+def is_cacheable(prompt: str) -> bool:
+    """
+    Check whether a prompt is long enough to benefit from prompt caching.
+
+    Prompts below the provider threshold are never cached, so emitting a cache
+    marker for them only pays the cache-write overhead. Results are memoized,
+    so the warning for a short prompt is logged once per distinct prompt.
+
+    Args:
+        prompt: System prompt to check
+
+    Returns:
+        True if the prompt meets the caching threshold
+    """
+    estimated_tokens = len(prompt) // 4
+    if estimated_tokens < MIN_CACHEABLE_TOKENS:
+        logger.warning("prompt prefix too short for caching (~%d < %d tokens)",
+                    estimated_tokens, MIN_CACHEABLE_TOKENS)
+        return False
+    return True
+
+
+def get_system_prompt_content(system_prompt: str) -> List[Dict[str, Any]]:
+    """
+    Build the agent system prompt blocks, with a cache point when worthwhile.
+
+    Args:
+        system_prompt: System prompt text
+
+    Returns:
+        System content blocks for Agent(system_prompt=...); a cachePoint block
+        follows the text only when the prompt is cacheable
+    """
+    content: List[Dict[str, Any]] = [{"text": system_prompt}]
+    if is_cacheable(system_prompt):
+        content.append({"cachePoint": {"type": "default"}})
+    return content
+
+
+@lru_cache(maxsize=64)
+def get_condensed_context(agent_type: str, complexity_level: str = "SIMPLE") -> str:
+    """
+    Get context based on project complexity to minimize token usage.
     
+    Args:
+        agent_type: Type of agent (business_analyst, developer, etc.)
+        complexity_level: SIMPLE, MODERATE, or COMPLEX
+        
+    Returns:
+        Optimized context string
+    """
     # For COMPLEX projects, load full context
     if complexity_level == "COMPLEX":
         return load_full_context(agent_type)
@@ -104,31 +195,36 @@ Files: code_review_report.md, quality_metrics.md (for SIMPLE)"""
         return get_moderate_context(agent_type)
     
     # For SIMPLE projects, use minimal context
-    return simple_contexts.get(agent_type, simple_contexts["business_analyst"])
+    prefix, suffix = _get_context_parts(agent_type)
+    return _canonicalize(prefix + "\n\n" + suffix)
 
 
+@lru_cache(maxsize=64)
 def get_moderate_context(agent_type: str) -> str:
     """Get medium-detail context for MODERATE projects."""
-    base_context = get_condensed_context(agent_type, "SIMPLE")
-    
-    if agent_type == "business_analyst":
-        return base_context + "\n\n## Additional Guidelines for MODERATE projects:\n- Include more detailed documentation\n- Add extra validation steps\n- Consider additional edge cases\n- Risk assessment should focus ONLY on technical risks in the implemented solution"
-    else:
-        return base_context + "\n\n## Additional Guidelines for MODERATE projects:\n- Include more detailed documentation\n- Add extra validation steps\n- Consider additional edge cases"
+    prefix, suffix = _get_context_parts(agent_type)
+    return _canonicalize(prefix + "\n\n" + _MODERATE_GUIDELINES + "\n\n" + suffix)
 
 
+@lru_cache(maxsize=64)
 def load_full_context(agent_type: str) -> str:
     """Load full context file for COMPLEX projects."""
-    script_dir = Path(__file__).parent
-    context_file = script_dir / "context" / f"{agent_type}.md"
+    context_file = _CONTEXT_DIR / f"{agent_type}.md"
     
     try:
         with open(context_file, "r", encoding="utf-8") as f:
-            return f.read()
+            return _canonicalize(f.read())
     except FileNotFoundError:
         return get_condensed_context(agent_type, "SIMPLE")
 
 
+def clear_context_cache() -> None:
+    """Drop memoized agent contexts so edited context/*.md files are re-read."""
+    get_condensed_context.cache_clear()
+    get_moderate_context.cache_clear()
+    load_full_context.cache_clear()
+
+
 def get_lean_project_context(project_path: str) -> str:
     """
     Get minimal project context (3-5 lines vs 71 lines).
@@ -139,13 +235,49 @@ def get_lean_project_context(project_path: str) -> str:
     Returns:
         Lean project context string
     """
-    return f"""## PROJECT INFO
+    return _canonicalize(f"""## PROJECT INFO
 Path: {project_path}
 Staging: {project_path}/staging/[agent_name]/
-Task: Create files in staging folder, return JSON with status/files/summary."""
+Task: Create files in staging folder, return JSON with status/files/summary.""")
+
 
+# File generation limits per complexity level. Built once at import and frozen
+# so every caller shares the same read-only template.
+_LIMITS: Mapping[str, Mapping[str, Union[int, Tuple[str, ...]]]] = MappingProxyType({
+    "SIMPLE": MappingProxyType({
+        "max_files": 3,
+        "max_lines_per_file": 100,
+        "business_analyst_files": ("complexity_assessment.md", "functional_specification.md", "user_stories.md"),
+        "software_architect_files": ("technical_specification.md", "system_architecture.md"),
+        "ui_designer_files": ("wireframes.md", "design_system.md"),
+        "developer_files": ("source_code/", "README.md", "tests/"),
+        "ui_tester_files": ("test_plan.md", "functional_tests.py"),
+        "code_reviewer_files": ("code_review_report.md", "quality_metrics.md")
+    }),
+    "MODERATE": MappingProxyType({
+        "max_files": 6,
+        "max_lines_per_file": 200,
+        "business_analyst_files": ("complexity_assessment.md", "functional_specification.md", "user_stories.md", "requirements.md", "stakeholder_analysis.md"),
+        "software_architect_files": ("technical_specification.md", "system_architecture.md", "technology_stack.md", "api_design_spec.md"),
+        "ui_designer_files": ("wireframes.md", "mockups.md", "design_system.md", "components.md"),
+        "developer_files": ("source_code/", "README.md", "tests/", "dependencies.md", "api_documentation.md"),
+        "ui_tester_files": ("test_plan.md", "functional_tests.py", "accessibility_tests.py", "performance_tests.py"),
+        "code_reviewer_files": ("code_review_report.md", "security_assessment.md", "performance_analysis.md", "quality_metrics.md")
+    }),
+    "COMPLEX": MappingProxyType({
+        "max_files": 12,
+        "max_lines_per_file": 500,
+        "business_analyst_files": ("complexity_assessment.md", "functional_specification.md", "user_stories.md", "requirements.md", "stakeholder_analysis.md", "risk_assessment.md", "business_processes.md", "success_metrics.md"),
+        "software_architect_files": ("technical_specification.md", "system_architecture.md", "technology_stack.md", "api_design_spec.md", "database_schema.md", "security_architecture.md", "deployment_architecture.md", "integration_patterns.md", "performance_strategy.md", "implementation_guidelines.md"),
+        "ui_designer_files": ("wireframes.md", "mockups.md", "design_system.md", "components.md", "responsive_design.md", "accessibility.md", "interactions.md", "user_testing.md"),
+        "developer_files": ("source_code/", "README.md", "dependencies.md", "tests/", "database/", "api_documentation.md", "deployment_config/", "implementation_notes.md", "performance_guide.md", "security_implementation.md", "development_guide.md"),
+        "ui_tester_files": ("test_plan.md", "test_cases.md", "functional_tests.py", "accessibility_tests.py", "performance_tests.py", "cross_browser_tests.py", "regression_tests.py", "test_data.json", "test_execution_report.md", "bug_reports.md", "testing_guidelines.md"),
+        "code_reviewer_files": ("code_review_report.md", "security_assessment.md", "performance_analysis.md", "quality_metrics.md", "best_practices_checklist.md", "refactoring_suggestions.md", "test_coverage_analysis.md", "documentation_review.md")
+    })
+})
 
-def get_complexity_based_file_limits(complexity_level: str) -> Dict[str, int]:
+
+def get_complexity_based_file_limits(complexity_level: str) -> Mapping[str, Union[int, Tuple[str, ...]]]:
     """
     Get file generation limits based on complexity.
     
@@ -153,39 +285,33 @@ def get_complexity_based_file_limits(complexity_level: str) -> Dict[str, int]:
         complexity_level: SIMPLE, MODERATE, or COMPLEX
         
     Returns:
-        Dictionary with file limits
-    """
-    limits = {
-        "SIMPLE": {
-            "max_files": 3,
-            "max_lines_per_file": 100,
-            "business_analyst_files": ["complexity_assessment.md", "functional_specification.md", "user_stories.md"],
-            "software_architect_files": ["technical_specification.md", "system_architecture.md"],
-            "ui_designer_files": ["wireframes.md", "design_system.md"],
-            "developer_files": ["source_code/", "README.md", "tests/"],
-            "ui_tester_files": ["test_plan.md", "functional_tests.py"],
-            "code_reviewer_files": ["code_review_report.md", "quality_metrics.md"]
-        },
-        "MODERATE": {
-            "max_files": 6,
-            "max_lines_per_file": 200,
-            "business_analyst_files": ["complexity_assessment.md", "functional_specification.md", "user_stories.md", "requirements.md", "stakeholder_analysis.md"],
-            "software_architect_files": ["technical_specification.md", "system_architecture.md", "technology_stack.md", "api_design_spec.md"],
-            "ui_designer_files": ["wireframes.md", "mockups.md", "design_system.md", "components.md"],
-            "developer_files": ["source_code/", "README.md", "tests/", "dependencies.md", "api_documentation.md"],
-            "ui_tester_files": ["test_plan.md", "functional_tests.py", "accessibility_tests.py", "performance_tests.py"],
-            "code_reviewer_files": ["code_review_report.md", "security_assessment.md", "performance_analysis.md", "quality_metrics.md"]
-        },
-        "COMPLEX": {
-            "max_files": 12,
-            "max_lines_per_file": 500,
-            "business_analyst_files": ["complexity_assessment.md", "functional_specification.md", "user_stories.md", "requirements.md", "stakeholder_analysis.md", "risk_assessment.md", "business_processes.md", "success_metrics.md"],
-            "software_architect_files": ["technical_specification.md", "system_architecture.md", "technology_stack.md", "api_design_spec.md", "database_schema.md", "security_architecture.md", "deployment_architecture.md", "integration_patterns.md", "performance_strategy.md", "implementation_guidelines.md"],
-            "ui_designer_files": ["wireframes.md", "mockups.md", "design_system.md", "components.md", "responsive_design.md", "accessibility.md", "interactions.md", "user_testing.md"],
-            "developer_files": ["source_code/", "README.md", "dependencies.md", "tests/", "database/", "api_documentation.md", "deployment_config/", "implementation_notes.md", "performance_guide.md", "security_implementation.md", "development_guide.md"],
-            "ui_tester_files": ["test_plan.md", "test_cases.md", "functional_tests.py", "accessibility_tests.py", "performance_tests.py", "cross_browser_tests.py", "regression_tests.py", "test_data.json", "test_execution_report.md", "bug_reports.md", "testing_guidelines.md"],
-            "code_reviewer_files": ["code_review_report.md", "security_assessment.md", "performance_analysis.md", "quality_metrics.md", "best_practices_checklist.md", "refactoring_suggestions.md", "test_coverage_analysis.md", "documentation_review.md"]
-        }
-    }
-    
-    return limits.get(complexity_level, limits["SIMPLE"])
\ No newline at end of file
+        Read-only mapping with file limits
+    """
+    return _LIMITS.get(complexity_level, _LIMITS["SIMPLE"])
+
+
+def get_file_list(complexity_level: str, agent_type: str) -> Tuple[str, ...]:
+    """
+    Get the expected output files for an agent at a complexity level.
+
+    Args:
+        complexity_level: SIMPLE, MODERATE, or COMPLEX
+        agent_type: Type of agent (business_analyst, developer, etc.)
+
+    Returns:
+        Tuple of file names, empty if the agent type is unknown
+    """
+    return get_complexity_based_file_limits(complexity_level).get(f"{agent_type}_files", ())
+
+
+def get_max_files(complexity_level: str) -> int:
+    """
+    Get the maximum number of files to generate at a complexity level.
+
+    Args:
+        complexity_level: SIMPLE, MODERATE, or COMPLEX
+
+    Returns:
+        Maximum file count
+    """
+    return get_complexity_based_file_limits(complexity_level)["max_files"]
@@ -5,8 +5,10 @@ Handles user interaction and delegates project management tasks.
 import sys
 import logging
 from pathlib import Path
-from project_manager import handle_user_request, continue_project
-from project_utils import list_projects
+
+# project_manager and project_utils pull in Strands, boto3 and every agent tool,
+# so they are imported inside the menu handlers that need them. Picking "Quit"
+# never pays that cost, and sys.modules makes later imports free.
 
 # # Enable debug logging for Strands
 # logging.getLogger("strands").setLevel(logging.INFO)
@@ -16,17 +18,22 @@ from project_utils import list_projects
 # )
 
 
+MAIN_MENU = (
+    "\n" + "=" * 60 + "\n"
+    "🚀 Software Engineer Squad - Multi-Agent Development System\n"
+    + "=" * 60 + "\n"
+    "Please select an option:\n"
+    "\n"
+    "1. 🆕 Create New Project\n"
+    "2. 📂 Continue Existing Project\n"
+    "3. ❌ Quit\n"
+    "\n"
+)
+
+
 def show_main_menu():
     """Display the main menu options."""
-    print("\n" + "=" * 60)
-    print("🚀 Software Engineer Squad - Multi-Agent Development System")
-    print("=" * 60)
-    print("Please select an option:")
-    print()
-    print("1. 🆕 Create New Project")
-    print("2. 📂 Continue Existing Project")
-    print("3. ❌ Quit")
-    print()
+    sys.stdout.write(MAIN_MENU)
 
 
 def get_user_choice():
@@ -49,10 +56,8 @@ def get_new_project_request():
     print("(Press Ctrl+D or Ctrl+Z then Enter to finish)")
 
     try:
-        full_input = sys.stdin.read()
-        lines = full_input.splitlines()
-        user_input = "\n".join(lines).strip()
-        return user_input
+        # Text-mode stdin already normalizes line endings to "\n"
+        return sys.stdin.read().strip()
     except (EOFError, KeyboardInterrupt):
         print("\n❌ Cancelled.")
         return None
@@ -60,17 +65,23 @@ def get_new_project_request():
 
 def show_project_menu():
     """Show existing projects and let user select one."""
+    from project_utils import list_projects
+
     projects = list_projects()
     if not projects:
         print("\n❌ No existing projects found.")
         input("Press Enter to continue...")
         return None
 
-    print(f"\n📂 Found {len(projects)} existing project(s):")
-    print("-" * 50)
-    for i, proj in enumerate(projects, 1):
-        print(f"  {i}. {proj['folder']} - {proj['title']}")
-    print("  0. 🔙 Back to main menu")
+    # Render the whole list with a single write instead of one print per project
+    project_lines = "\n".join(
+        f"  {i}. {proj['folder']} - {proj['title']}" for i, proj in enumerate(projects, 1))
+    sys.stdout.write(
+        f"\n📂 Found {len(projects)} existing project(s):\n"
+        f"{'-' * 50}\n"
+        f"{project_lines}\n"
+        "  0. 🔙 Back to main menu\n"
+    )
 
     while True:
         try:
@@ -94,6 +105,8 @@ def show_project_menu():
 
 def handle_existing_project(project_path):
     """Handle continuation of an existing project."""
+    from project_manager import continue_project
+
     print(f"\n📁 Selected project: {Path(project_path).name}")
     print(f"📂 Location: {project_path}")
 
@@ -102,9 +115,7 @@ def handle_existing_project(project_path):
 
     try:
         # This will immediately catch Ctrl+D/Ctrl+Z without requiring Enter first
-        additional_input = sys.stdin.read()
-        additional_lines = additional_input.splitlines()
-        additional_request = "\n".join(additional_lines).strip()
+        additional_request = sys.stdin.read().strip()
 
         if additional_request:
             print(f"\n📋 Request: {additional_request}")
@@ -134,6 +145,8 @@ def run_interactive_session():
             # Create new project
             user_input = get_new_project_request()
             if user_input:
+                from project_manager import handle_user_request
+
                 print(f"\n📋 Request: {user_input}")
                 handle_user_request(user_input)
                 input("\nPress Enter to continue...")
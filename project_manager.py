@@ -2,6 +2,7 @@
 Project Manager - Main orchestrator for the software engineering squad.
 Handles project creation, agent coordination, and workflow management.
 """
+from functools import lru_cache
 from pathlib import Path
 
 from strands import Agent
@@ -25,8 +26,9 @@ bedrock_model = BedrockModel(
 )
 
 
+@lru_cache(maxsize=1)
 def load_project_manager_prompt() -> str:
-    """Load the project manager system prompt."""
+    """Load the project manager system prompt (read from disk once per process)."""
     script_dir = Path(__file__).parent
     context_file = script_dir / "context" / "project_manager.md"
     with open(context_file, "r", encoding="utf-8") as f:
@@ -91,11 +93,11 @@ def handle_user_request(user_input: str) -> None:
 
 def show_projects_list() -> None:
     """Display the list of existing projects."""
-    projects = list_projects()
+    projects = list_projects(limit=10)  # Show last 10 projects
     if projects:
         print("\n📂 Existing Projects:")
         print("-" * 50)
-        for i, proj in enumerate(projects[:10], 1):  # Show last 10 projects
+        for i, proj in enumerate(projects, 1):
             print(f"  {i}. {proj['folder']} - {proj['title']}")
     else:
         print("\n📂 No projects found.")
@@ -108,7 +110,7 @@ def select_project() -> str:
     Returns:
         str: Path to selected project, or empty string if cancelled
     """
-    projects = list_projects()
+    projects = list_projects(limit=10)
     if not projects:
         print("❌ No existing projects found.")
         return ""
@@ -116,7 +118,7 @@ def select_project() -> str:
     # Show projects with numbers
     print("\n📂 Select a project:")
     print("-" * 50)
-    for i, proj in enumerate(projects[:10], 1):
+    for i, proj in enumerate(projects, 1):
         print(f"  {i}. {proj['folder']} - {proj['title']}")
 
     # Get user selection
@@ -2,36 +2,42 @@
 Project management utilities for the coding squad system.
 Handles project folder creation, organization, and management.
 """
-import json
+import heapq
+import itertools
+import logging
 import os
 import re
+import string
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; fall back to the standard library
+    import json as _json
 
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
-from dotenv import dotenv_values
 from strands import Agent
 from strands.models import BedrockModel
 
 from constants import MODEL_MINOR_TASK
+from context_manager import get_system_prompt_content
 
-# Global variable to track current project
-_current_project: Optional[str] = None
-
+logger = logging.getLogger(__name__)
 
-def generate_project_title_with_agent(user_request: str) -> str:
-    """
-    Generate a project title using an AI agent to analyze the user request.
+# Current project, tracked per thread / asyncio task
+_current_project: ContextVar[Optional[str]] = ContextVar("_current_project", default=None)
 
-    Args:
-        user_request (str): User's project request
-
-    Returns:
-        str: Generated project title
-    """
-    naming_prompt = """You are a project naming assistant. Your task is to analyze user requirements and suggest a concise, descriptive project name.
+# System prompt for the project naming assistant
+_NAMING_PROMPT = """You are a project naming assistant. Your task is to analyze user requirements and suggest a concise, descriptive project name.
 
 Rules for project names:
 1. Use only lowercase letters, numbers, and underscores
@@ -48,33 +54,195 @@ Examples:
 
 Respond with ONLY the suggested project name, no explanations or additional text."""
 
-    try:
-        bedrock_model = BedrockModel(
-            model_id=MODEL_MINOR_TASK,
-            temperature=0.2,
-            top_p=0.8
-        )
+# Bytes allowed in project folder names; everything else is stripped
+_NAME_ALLOWED_BYTES = (string.ascii_letters + string.digits + "_-").encode("ascii")
+_NAME_DELETE_BYTES = bytes(b for b in range(256) if b not in _NAME_ALLOWED_BYTES)
+
+# Words extracted from a request when generating a fallback title
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+
+# PROJECT_INFO.md title line marker, and how much of the file to read for it
+_TITLE_MARKER = "**Project Title:**"
+_INFO_HEADER_BYTES = 512
+
+# Common words filtered out of fallback titles
+_STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+    'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+    'to', 'was', 'were', 'will', 'with', 'i', 'want', 'need', 'can',
+    'would', 'like', 'please', 'help', 'me', 'my', 'we', 'us', 'our'
+})
+
+# Worker agents, each with a staging folder (kept for traceability)
+_AGENTS = ("business_analyst", "software_architect",
+           "ui_designer", "developer", "ui_tester", "code_reviewer")
+
+# Leaf folders of a new project - os.makedirs creates the parent folders
+# (src, docs, assets, staging) along the way
+_MAIN_LEAVES = (
+    "src/app",          # Main application code
+    "src/tests",        # Test files
+    "src/config",       # Configuration files
+    "docs/requirements",  # Business analysis documents
+    "docs/architecture",  # Software architecture documents
+    "docs/reviews",     # Code review documents
+    "docs/api",         # API documentation
+    "assets/designs",   # UI designs and wireframes
+    "assets/images",    # Images and graphics
+    "assets/data",      # Sample/test data
+)
+_STAGING_LEAVES = tuple(f"staging/{agent}" for agent in _AGENTS)
+
+# Display names of the worker agents, e.g. "ui_tester" -> "Ui Tester"
+_AGENT_DISPLAY = {agent: agent.replace('_', ' ').title() for agent in _AGENTS}
+
+# Initial README written to each agent staging folder
+_STAGING_README_TPL = """# {display} Staging
+
+Working folder for the {raw} agent.
+Files are generated dynamically based on task requirements.
+"""
+
+# README files explaining the purpose of each project subfolder
+_FOLDER_READMES = {
+    "src": "# Source Code\n\nApplication source code organized by modules and components.\n\n- `app/` - Main application code\n- `tests/` - Test files and test suites\n- `config/` - Configuration files and settings",
+    "docs": "# Documentation\n\nTechnical documentation, user guides, and project specifications.\n\n- `requirements/` - Business requirements and analysis\n- `architecture/` - System architecture and design\n- `reviews/` - Code review reports and assessments\n- `api/` - API documentation and specifications",
+    "assets": "# Assets\n\nStatic resources and design materials.\n\n- `designs/` - UI wireframes, mockups, and design specifications\n- `images/` - Images, icons, and graphics\n- `data/` - Sample data and test fixtures",
+    "docs/requirements": "# Requirements Documentation\n\nBusiness analysis, user stories, and project requirements generated by the Business Analyst agent.",
+    "docs/architecture": "# Architecture Documentation\n\nSystem architecture, technical specifications, and design decisions generated by the Software Architect agent.",
+    "docs/reviews": "# Code Review Documentation\n\nCode quality assessments, security reviews, and improvement recommendations generated by the Code Reviewer agent.",
+    "docs/api": "# API Documentation\n\nAPI specifications, endpoint documentation, and integration guides.",
+    "assets/designs": "# Design Assets\n\nUI/UX wireframes, mockups, design systems, and visual specifications generated by the UI Designer agent.",
+    "assets/images": "# Image Assets\n\nImages, icons, logos, and graphics used in the project.",
+    "assets/data": "# Data Assets\n\nSample data, test fixtures, and data files used for development and testing.",
+    "src/app": "# Application Code\n\nMain application source code organized by features and modules.",
+    "src/tests": "# Test Files\n\nTest suites, test cases, and testing utilities generated by the UI Tester agent.",
+    "src/config": "# Configuration Files\n\nApplication configuration, environment settings, and deployment configurations."
+}
+
+# Static README contents, UTF-8 encoded once at import
+_FOLDER_README_BYTES = {folder: content.encode("utf-8")
+                        for folder, content in _FOLDER_READMES.items()}
+_STAGING_README_BYTES = {
+    agent: _STAGING_README_TPL.format(display=_AGENT_DISPLAY[agent],
+                                      raw=agent.replace('_', ' ')).encode("utf-8")
+    for agent in _AGENTS
+}
+
+# Markers delimiting the agent progress section of the project README
+_PROGRESS_START = "<!-- AGENT_PROGRESS_START -->"
+_PROGRESS_END = "<!-- AGENT_PROGRESS_END -->"
+
+# Compiled per-agent progress section patterns, keyed by agent name
+_AGENT_SECTION_RE_CACHE: Dict[str, "re.Pattern[str]"] = {}
+
+# Background pool for README updates, so tools can return without waiting on disk I/O
+_README_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="readme")
+
+# Buffer size for atomic README writes, large enough to write a README in one go
+_WRITE_BUFFER_BYTES = 1 << 20
+
+# Per-path locks guarding README read-modify-write cycles
+_readme_locks: Dict[str, threading.Lock] = {}
+_readme_locks_guard = threading.Lock()
+
+# Last project README content written per path, with its mtime_ns at write time
+_readme_cache: Dict[str, Tuple[int, str]] = {}
+
+
+@lru_cache(maxsize=16)
+def _pp(project_path: str) -> Path:
+    """Convert a project path to a Path, reusing recent conversions."""
+    return Path(project_path)
+
+
+@lru_cache(maxsize=1)
+def _get_naming_model() -> BedrockModel:
+    """Create the naming model (and its Bedrock client) once per process."""
+    return BedrockModel(
+        model_id=MODEL_MINOR_TASK,
+        temperature=0.2,
+        top_p=0.8
+    )
+
 
-        agent = Agent(model=bedrock_model,
-                      system_prompt=naming_prompt, tools=[])
-        response = agent(f"Generate a project name for: {user_request}")
+class _NamingRequest:
+    """A user request that compares equal to others differing only in case or surrounding whitespace."""
+    __slots__ = ("text", "key")
 
-        # Extract and clean the response
-        suggested_name = str(response).strip().lower()
+    def __init__(self, text: str):
+        self.text = text
+        self.key = text.strip().lower()
 
-        # Clean and validate the name
-        suggested_name = re.sub(r'[^\w\-_]', '', suggested_name)
-        suggested_name = suggested_name[:50]  # Limit length
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _NamingRequest) and self.key == other.key
 
-        if suggested_name and len(suggested_name) > 0:
-            return suggested_name
-        else:
-            return generate_fallback_title(user_request)
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+
+@lru_cache(maxsize=256)
+def _suggest_project_name(request: _NamingRequest) -> str:
+    """
+    Ask the naming agent for a project name, caching results per request.
+
+    The cache is keyed on the normalized request, but the agent sees the
+    request as the user wrote it. A fresh Agent is created per call because
+    agents keep conversation history; the underlying model is shared.
+    Failures raise and are therefore not cached.
+    """
+    agent = Agent(model=_get_naming_model(),
+                  system_prompt=get_system_prompt_content(_NAMING_PROMPT), tools=[])
+    response = agent(f"Generate a project name for: {request.text}")
 
+    # Extract and clean the response
+    suggested_name = str(response).strip().lower()
+    suggested_name = _sanitize_name(suggested_name)
+
+    # Diagnostics only; a missing metrics field must not discard the name
+    usage = getattr(getattr(response, "metrics", None), "accumulated_usage", None) or {}
+    logger.debug("naming agent cache read tokens: %s",
+                 usage.get("cacheReadInputTokens", 0))
+
+    return suggested_name[:50]  # Limit length
+
+
+def generate_project_title_with_agent(user_request: str) -> str:
+    """
+    Generate a project title using an AI agent to analyze the user request.
+
+    Identical requests (ignoring case and surrounding whitespace) reuse the
+    previously generated name instead of calling Bedrock again.
+
+    Args:
+        user_request (str): User's project request
+
+    Returns:
+        str: Generated project title
+    """
+    try:
+        suggested_name = _suggest_project_name(_NamingRequest(user_request))
     except Exception:
         # Fallback to simple method if agent fails
         return generate_fallback_title(user_request)
 
+    if suggested_name:
+        return suggested_name
+    return generate_fallback_title(user_request)
+
+
+def _sanitize_name(name: str) -> str:
+    """
+    Strip every character except ASCII letters, digits, underscores and hyphens.
+
+    Args:
+        name (str): Raw project name
+
+    Returns:
+        str: Name that is safe to use as a folder name
+    """
+    return name.encode("ascii", "ignore").translate(None, _NAME_DELETE_BYTES).decode("ascii")
+
 
 def generate_fallback_title(user_request: str) -> str:
     """
@@ -86,28 +254,16 @@ def generate_fallback_title(user_request: str) -> str:
     Returns:
         str: Generated project title
     """
-    # Extract key words and create a title
-    words = re.findall(r'\b[a-zA-Z]+\b', user_request.lower())
-
-    # Filter out common words
-    stop_words = {
-        'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-        'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-        'to', 'was', 'were', 'will', 'with', 'i', 'want', 'need', 'can',
-        'would', 'like', 'please', 'help', 'me', 'my', 'we', 'us', 'our'
-    }
+    # Take the first 4 meaningful words, stopping the scan once they are found
+    words = (match.group() for match in _WORD_RE.finditer(user_request.lower()))
+    title_words = list(itertools.islice(
+        (word for word in words if word not in _STOP_WORDS), 4))
 
-    meaningful_words = [word for word in words if word not in stop_words]
-
-    # Take first 3-4 meaningful words or use fallback
-    if meaningful_words:
-        title_words = meaningful_words[:4]
-        title = '_'.join(title_words)
-    else:
-        title = "project"
+    # Use fallback if no meaningful words were found
+    title = '_'.join(title_words) if title_words else "project"
 
     # Clean title and ensure it's valid for folder names
-    title = re.sub(r'[^\w\-_]', '', title)
+    title = _sanitize_name(title)
     title = title[:50]  # Limit length
 
     return title
@@ -125,41 +281,45 @@ def create_project_folder(user_request: str, custom_title: Optional[str] = None,
     Returns:
         str: Path to the created project folder
     """
-    global _current_project
-
     base_path_obj = Path(base_path)
 
     # Generate title
     if custom_title:
-        title = re.sub(r'[^\w\-_]', '', custom_title)
+        title = _sanitize_name(custom_title)
     else:
         title = generate_project_title_with_agent(user_request)
 
-    # Create folder name with date
-    date_str = datetime.now().strftime("%Y%m%d")
-    folder_name = f"project_{date_str}_{title}"
+    # Create folder name with date, just the date if the title sanitized away
+    date_str = time.strftime("%Y%m%d")
+    folder_name = f"project_{date_str}_{title}" if title else f"project_{date_str}"
 
-    # Ensure unique folder name
-    counter = 1
-    original_folder_name = folder_name
-    while (base_path_obj / folder_name).exists():
-        folder_name = f"{original_folder_name}_{counter}"
-        counter += 1
+    # Create project folder, adding a counter suffix until the name is unique
+    for counter in itertools.count():
+        project_path = base_path_obj / (
+            folder_name if counter == 0 else f"{folder_name}_{counter}")
+        try:
+            project_path.mkdir()
+            break
+        except FileExistsError:
+            continue
 
-    # Create project folder
-    project_path = base_path_obj / folder_name
-    project_path.mkdir(exist_ok=True)
+    # Title the project after its folder if there is no usable title
+    title = title or project_path.name
 
     # Create subfolders
     _create_subfolders(project_path)
 
-    # Create project info file
-    _create_project_info(project_path, user_request, title)
-
-    # Create initial project README
-    create_project_readme(str(project_path))
-
-    _current_project = str(project_path)
+    # Write the folder READMEs, project info file and initial project README
+    # in one batch once every folder exists
+    files = _folder_readme_files(project_path)
+    files.extend(_staging_readme_files(project_path))
+    info_path, info_content = _project_info_file(project_path, user_request, title)
+    files.append((info_path, info_content.encode("utf-8")))
+    files.append((project_path / "README.md",
+                  _project_readme_content(project_path.name, title).encode("utf-8")))
+    _write_files(files)
+
+    _current_project.set(str(project_path))
     return str(project_path)
 
 
@@ -170,92 +330,50 @@ def _create_subfolders(project_path: Path) -> None:
     Args:
         project_path (Path): Path to the project folder
     """
-    # Main project structure
-    main_folders = [
-        "src",              # Source code
-        "src/app",          # Main application code
-        "src/tests",        # Test files
-        "src/config",       # Configuration files
-        "docs",             # Documentation
-        "docs/requirements",  # Business analysis documents
-        "docs/architecture",  # Software architecture documents
-        "docs/reviews",     # Code review documents
-        "docs/api",         # API documentation
-        "assets",           # Static resources
-        "assets/designs",   # UI designs and wireframes
-        "assets/images",    # Images and graphics
-        "assets/data"       # Sample/test data
-    ]
-
-    # Worker agent staging folders (kept for traceability)
-    staging_folders = [
-        "staging/business_analyst",    # Business analyst working files
-        "staging/software_architect",  # Software architect working files
-        "staging/ui_designer",         # UI designer working files
-        "staging/developer",           # Developer working files
-        "staging/ui_tester",           # UI tester working files
-        "staging/code_reviewer"        # Code reviewer working files
-    ]
-
-    # Create main subfolders
-    for subfolder in main_folders:
-        (project_path / subfolder).mkdir(parents=True, exist_ok=True)
-
-    # Create staging folders
-    for staging_folder in staging_folders:
-        (project_path / staging_folder).mkdir(parents=True, exist_ok=True)
-
-    # Create README files in key folders
-    _create_folder_readmes(project_path)
-    _create_staging_readmes(project_path)
-
-
-def _create_folder_readmes(project_path: Path) -> None:
-    """Create README files in subfolders to explain their purpose."""
-    readme_content = {
-        "src": "# Source Code\n\nApplication source code organized by modules and components.\n\n- `app/` - Main application code\n- `tests/` - Test files and test suites\n- `config/` - Configuration files and settings",
-        "docs": "# Documentation\n\nTechnical documentation, user guides, and project specifications.\n\n- `requirements/` - Business requirements and analysis\n- `architecture/` - System architecture and design\n- `reviews/` - Code review reports and assessments\n- `api/` - API documentation and specifications",
-        "assets": "# Assets\n\nStatic resources and design materials.\n\n- `designs/` - UI wireframes, mockups, and design specifications\n- `images/` - Images, icons, and graphics\n- `data/` - Sample data and test fixtures",
-        "docs/requirements": "# Requirements Documentation\n\nBusiness analysis, user stories, and project requirements generated by the Business Analyst agent.",
-        "docs/architecture": "# Architecture Documentation\n\nSystem architecture, technical specifications, and design decisions generated by the Software Architect agent.",
-        "docs/reviews": "# Code Review Documentation\n\nCode quality assessments, security reviews, and improvement recommendations generated by the Code Reviewer agent.",
-        "docs/api": "# API Documentation\n\nAPI specifications, endpoint documentation, and integration guides.",
-        "assets/designs": "# Design Assets\n\nUI/UX wireframes, mockups, design systems, and visual specifications generated by the UI Designer agent.",
-        "assets/images": "# Image Assets\n\nImages, icons, logos, and graphics used in the project.",
-        "assets/data": "# Data Assets\n\nSample data, test fixtures, and data files used for development and testing.",
-        "src/app": "# Application Code\n\nMain application source code organized by features and modules.",
-        "src/tests": "# Test Files\n\nTest suites, test cases, and testing utilities generated by the UI Tester agent.",
-        "src/config": "# Configuration Files\n\nApplication configuration, environment settings, and deployment configurations."
-    }
-
-    for folder_path, content in readme_content.items():
-        readme_path = project_path / folder_path / "README.md"
-        readme_path.write_text(content, encoding="utf-8")
-
-
-def _create_staging_readmes(project_path: Path) -> None:
-    """Create simple README files in staging folders."""
-    agents = ["business_analyst", "software_architect",
-              "ui_designer", "developer", "ui_tester", "code_reviewer"]
-
-    for agent in agents:
-        readme_content = f"""# {agent.replace('_', ' ').title()} Staging
-
-Working folder for the {agent.replace('_', ' ')} agent.
-Files are generated dynamically based on task requirements.
-"""
-        readme_path = project_path / "staging" / agent / "README.md"
-        readme_path.write_text(readme_content, encoding="utf-8")
+    base = os.fspath(project_path)
+    for leaf in _MAIN_LEAVES + _STAGING_LEAVES:
+        os.makedirs(os.path.join(base, leaf), exist_ok=True)
+
+
+def _folder_readme_files(project_path: Path) -> List[Tuple[Path, bytes]]:
+    """Build README files for subfolders that explain their purpose."""
+    return [(project_path / folder_path / "README.md", blob)
+            for folder_path, blob in _FOLDER_README_BYTES.items()]
+
+
+def _staging_readme_files(project_path: Path) -> List[Tuple[Path, bytes]]:
+    """Build simple README files for staging folders."""
+    return [(project_path / "staging" / agent / "README.md", blob)
+            for agent, blob in _STAGING_README_BYTES.items()]
 
 
-def _create_project_info(project_path: Path, user_request: str, title: str) -> None:
+def _write_files(files: List[Tuple[Path, bytes]]) -> None:
     """
-    Create a project information file.
+    Write independent files concurrently.
+
+    Args:
+        files (List[Tuple[Path, bytes]]): (path, UTF-8 content) pairs to write
+    """
+    def write(item: Tuple[Path, bytes]) -> None:
+        path, content = item
+        path.write_bytes(content)
+
+    # Consume the results so any write error is raised here
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(write, files))
+
+
+def _project_info_file(project_path: Path, user_request: str, title: str) -> Tuple[Path, str]:
+    """
+    Build the project information file.
 
     Args:
         project_path (Path): Path to the project folder
         user_request (str): Original user request
         title (str): Project title
+
+    Returns:
+        Tuple[Path, str]: PROJECT_INFO.md path and content
     """
     info_content = f"""# Project Information
 
@@ -277,60 +395,81 @@ def _create_project_info(project_path: Path, user_request: str, title: str) -> N
 - **Progress:** Started
 """
 
-    info_path = project_path / "PROJECT_INFO.md"
-    info_path.write_text(info_content, encoding="utf-8")
+    return project_path / "PROJECT_INFO.md", info_content
 
 
 def get_current_project_path() -> Optional[str]:
     """Get the current project path."""
-    return _current_project
+    return _current_project.get()
 
 
-def list_projects(base_path: str = ".") -> List[Dict[str, str]]:
+def list_projects(base_path: str = ".", limit: Optional[int] = None) -> List[Dict[str, str]]:
     """
-    List all existing projects.
+    List existing projects, newest first.
 
     Args:
         base_path (str): Base path where projects are located
+        limit (int, optional): Maximum number of projects to return. Only the
+            returned projects have their PROJECT_INFO.md parsed.
 
     Returns:
         List[Dict[str, str]]: List of project information
     """
     base_path_obj = Path(base_path)
+    candidates = []
+
+    # DirEntry caches the directory type and stat result from the scan itself
+    with os.scandir(base_path) as entries:
+        for entry in entries:
+            if entry.name.startswith("project_") and entry.is_dir():
+                if os.path.exists(os.path.join(entry.path, "PROJECT_INFO.md")):
+                    candidates.append((entry.stat().st_ctime, entry.name))
+
+    # Sort by creation time (newest first), keeping only the projects we return
+    if limit is None:
+        candidates.sort(key=itemgetter(0), reverse=True)
+    else:
+        candidates = heapq.nlargest(limit, candidates, key=itemgetter(0))
+
     projects = []
+    for created, folder in candidates:
+        item = base_path_obj / folder
+        info_file = item / "PROJECT_INFO.md"
+        try:
+            # The title sits near the top, so only the header is read
+            with info_file.open("rb") as f:
+                header = f.read(_INFO_HEADER_BYTES).decode("utf-8", errors="ignore")
+            title = _parse_project_title(header) or item.name
+        except Exception:
+            # Fallback if info file is corrupted
+            title = item.name
+
+        projects.append({
+            "folder": item.name,
+            "title": title,
+            "path": str(item),
+            "created": created
+        })
 
-    for item in base_path_obj.iterdir():
-        if item.is_dir() and item.name.startswith("project_"):
-            info_file = item / "PROJECT_INFO.md"
-            if info_file.exists():
-                try:
-                    content = info_file.read_text(encoding="utf-8")
-                    # Extract title from content
-                    title_line = [line for line in content.split(
-                        '\n') if line.startswith('**Project Title:**')]
-                    title = title_line[0].split(
-                        ':', 1)[1].strip() if title_line else item.name
-
-                    projects.append({
-                        "folder": item.name,
-                        "title": title,
-                        "path": str(item),
-                        "created": item.stat().st_ctime
-                    })
-                except Exception:
-                    # Fallback if info file is corrupted
-                    projects.append({
-                        "folder": item.name,
-                        "title": item.name,
-                        "path": str(item),
-                        "created": item.stat().st_ctime
-                    })
-
-    # Sort by creation time (newest first)
-    projects.sort(key=lambda x: x["created"], reverse=True)
     return projects
 
 
+def _parse_project_title(info_content: str) -> Optional[str]:
+    """
+    Extract the project title from PROJECT_INFO.md content.
+
+    Args:
+        info_content (str): Content (or leading part) of PROJECT_INFO.md
+
+    Returns:
+        Optional[str]: Project title, or None if no title line is present
+    """
+    _, marker, rest = info_content.partition(_TITLE_MARKER)
+    if not marker:
+        return None
+    return rest.split('\n', 1)[0].strip()
+
+
 def set_current_project(project_path: str) -> bool:
     """
     Set the current active project.
@@ -341,14 +480,40 @@ def set_current_project(project_path: str) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    global _current_project
-
-    if Path(project_path).exists():
-        _current_project = project_path
+    if _pp(project_path).exists():
+        _current_project.set(project_path)
         return True
     return False
 
 
+def _display_name(agent_name: str) -> str:
+    """Get the display name of an agent, e.g. "ui_tester" -> "Ui Tester"."""
+    display_name = _AGENT_DISPLAY.get(agent_name)
+    if display_name is None:
+        display_name = agent_name.replace('_', ' ').title()
+    return display_name
+
+
+def _parse_agent_response(agent_response: str) -> Optional[Dict]:
+    """
+    Parse an agent's JSON response.
+
+    Args:
+        agent_response (str): Agent response (AgentResult or str)
+
+    Returns:
+        Optional[Dict]: Parsed response, or None if it is not a JSON object
+    """
+    # Convert AgentResult to string first, and skip the parser for plain text
+    text = str(agent_response).strip()
+    if not text or text[0] != "{":
+        return None
+    try:
+        return _json.loads(text)
+    except ValueError:  # json/orjson JSONDecodeError both subclass ValueError
+        return None
+
+
 def update_agent_staging_readme(project_path: str, agent_name: str, agent_response: str) -> None:
     """
     Update the agent's staging README.md file with generated file information.
@@ -358,15 +523,18 @@ def update_agent_staging_readme(project_path: str, agent_name: str, agent_respon
         agent_name (str): Name of the agent (e.g., "business_analyst")
         agent_response (str): JSON response from the agent
     """
-    try:
-        # Parse the JSON response - convert AgentResult to string first
-        try:
-            response_data = json.loads(str(agent_response))
-        except json.JSONDecodeError:
-            # If not valid JSON, skip update
-            return
+    _update_staging_readme(project_path, agent_name,
+                           _parse_agent_response(agent_response))
+
 
-        project_path_obj = Path(project_path)
+def _update_staging_readme(project_path: str, agent_name: str, response_data: Optional[Dict]) -> None:
+    """Write the agent's staging README.md from its parsed response (no-op if None)."""
+    # Not a valid JSON response, skip update
+    if response_data is None:
+        return
+
+    try:
+        project_path_obj = _pp(project_path)
         staging_path = project_path_obj / "staging" / agent_name
         readme_path = staging_path / "README.md"
 
@@ -378,7 +546,7 @@ def update_agent_staging_readme(project_path: str, agent_name: str, agent_respon
             agent_name, response_data)
 
         # Write README content
-        readme_path.write_text(readme_content, encoding="utf-8")
+        _write_atomic(readme_path, readme_content)
 
     except Exception as e:
         # Don't fail the main workflow if README update fails
@@ -388,15 +556,15 @@ def update_agent_staging_readme(project_path: str, agent_name: str, agent_respon
 def _generate_staging_readme_content(agent_name: str, response_data: Dict) -> str:
     """Generate README content for agent staging folder."""
 
-    agent_display_name = agent_name.replace('_', ' ').title()
+    agent_display_name = _display_name(agent_name)
 
     # Get response information
     summary = response_data.get('summary', 'Agent completed its tasks.')
     status = response_data.get('status', 'completed')
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    # Start building content
-    content = f"""# {agent_display_name} - Generated Files
+    # Collect sections in a list and join once at the end
+    parts = [f"""# {agent_display_name} - Generated Files
 
 **Status:** {status.upper()}  
 **Last Updated:** {timestamp}
@@ -405,12 +573,13 @@ def _generate_staging_readme_content(agent_name: str, response_data: Dict) -> st
 
 {summary}
 
-"""
+"""]
+    append = parts.append
 
     # Add generated files section
     generated_files = response_data.get('generated_files', [])
     if generated_files:
-        content += "## Generated Files\n\n"
+        append("## Generated Files\n\n")
 
         for file_info in generated_files:
             file_name = file_info.get('file_name', 'Unknown file')
@@ -418,39 +587,34 @@ def _generate_staging_readme_content(agent_name: str, response_data: Dict) -> st
                 'content_description', 'No description provided')
             key_insights = file_info.get('key_insights', [])
 
-            content += f"### {file_name}\n\n"
-            content += f"**Description:** {description}\n\n"
+            append(f"### {file_name}\n\n**Description:** {description}\n\n")
 
             if key_insights:
-                content += "**Key Insights:**\n"
-                for insight in key_insights:
-                    content += f"- {insight}\n"
-                content += "\n"
+                append("**Key Insights:**\n")
+                parts.extend(f"- {insight}\n" for insight in key_insights)
+                append("\n")
 
     # Add recommendations section
     recommendations = response_data.get('recommendations', [])
     if recommendations:
-        content += "## Recommendations\n\n"
-        for rec in recommendations:
-            content += f"- {rec}\n"
-        content += "\n"
+        append("## Recommendations\n\n")
+        parts.extend(f"- {rec}\n" for rec in recommendations)
+        append("\n")
 
     # Add downstream inputs if available
     downstream_inputs = response_data.get('downstream_inputs', {})
     if downstream_inputs:
-        content += "## Information for Downstream Agents\n\n"
+        append("## Information for Downstream Agents\n\n")
 
         for next_agent, inputs in downstream_inputs.items():
-            content += f"### For {next_agent.replace('_', ' ').title()}\n\n"
-
-            for param_name, param_value in inputs.items():
-                content += f"**{param_name}:** {param_value}\n\n"
+            append(f"### For {_display_name(next_agent)}\n\n")
+            parts.extend(f"**{param_name}:** {param_value}\n\n"
+                         for param_name, param_value in inputs.items())
 
     # Add footer
-    content += "---\n\n"
-    content += f"*Generated by {agent_display_name} agent from the Strands Coding Squad*\n"
+    append(f"---\n\n*Generated by {agent_display_name} agent from the Strands Coding Squad*\n")
 
-    return content
+    return "".join(parts)
 
 
 def create_project_readme(project_path: str) -> None:
@@ -461,7 +625,7 @@ def create_project_readme(project_path: str) -> None:
         project_path (str): Path to the project folder
     """
     try:
-        project_path_obj = Path(project_path)
+        project_path_obj = _pp(project_path)
         readme_path = project_path_obj / "README.md"
 
         # Get project information
@@ -473,15 +637,31 @@ def create_project_readme(project_path: str) -> None:
         if info_file.exists():
             try:
                 info_content = info_file.read_text(encoding="utf-8")
-                title_line = [line for line in info_content.split(
-                    '\n') if line.startswith('**Project Title:**')]
-                if title_line:
-                    project_title = title_line[0].split(':', 1)[1].strip()
+                project_title = _parse_project_title(
+                    info_content) or project_title
             except Exception:
                 pass
 
-        # Create initial README content
-        readme_content = f"""# {project_title}
+        # Write README file
+        readme_path.write_text(_project_readme_content(
+            project_name, project_title), encoding="utf-8")
+
+    except Exception as e:
+        print(f"⚠️  Warning: Could not create project README.md: {e}")
+
+
+def _project_readme_content(project_name: str, project_title: str) -> str:
+    """
+    Build the initial project README.md content.
+
+    Args:
+        project_name (str): Project folder name
+        project_title (str): Project title
+
+    Returns:
+        str: README content
+    """
+    return f"""# {project_title}
 
 ## Project Overview
 
@@ -534,12 +714,6 @@ Each agent creates files in their respective staging folders:
 *Generated by [Strands Coding Squad](https://github.com/strands-agents/sdk-python)*
 """
 
-        # Write README file
-        readme_path.write_text(readme_content, encoding="utf-8")
-
-    except Exception as e:
-        print(f"⚠️  Warning: Could not create project README.md: {e}")
-
 
 def update_project_readme_with_agent_work(project_path: str, agent_name: str, agent_response: str) -> None:
     """
@@ -550,42 +724,136 @@ def update_project_readme_with_agent_work(project_path: str, agent_name: str, ag
         agent_name (str): Name of the agent
         agent_response (str): JSON response from the agent
     """
-    try:
-        # Parse the JSON response - convert AgentResult to string first
-        try:
-            response_data = json.loads(str(agent_response))
-        except json.JSONDecodeError:
-            return
+    _update_project_readme(project_path, agent_name,
+                           _parse_agent_response(agent_response))
 
-        project_path_obj = Path(project_path)
-        readme_path = project_path_obj / "README.md"
 
-        # Create README if it doesn't exist
-        if not readme_path.exists():
-            create_project_readme(project_path)
+def _update_project_readme(project_path: str, agent_name: str, response_data: Optional[Dict]) -> None:
+    """Record the agent's progress in the project README.md from its parsed response (no-op if None)."""
+    # Not a valid JSON response, skip update
+    if response_data is None:
+        return
 
-        # Read current README content
-        current_content = readme_path.read_text(encoding="utf-8")
+    try:
+        project_path_obj = _pp(project_path)
+        readme_path = project_path_obj / "README.md"
 
         # Generate agent progress entry
         agent_progress = _generate_agent_progress_entry(
             agent_name, response_data)
 
-        # Update README with agent progress
-        updated_content = _update_project_readme_progress(
-            current_content, agent_name, agent_progress)
+        # Agents share the project README, so serialize read-modify-write per path
+        with _readme_lock(readme_path):
+            # Create README if it doesn't exist
+            if not readme_path.exists():
+                create_project_readme(project_path)
+
+            # Read current README content (from cache unless changed on disk)
+            current_content = _read_project_readme(readme_path)
+
+            # Update README with agent progress
+            updated_content = _update_project_readme_progress(
+                current_content, agent_name, agent_progress)
 
-        # Write updated content back
-        readme_path.write_text(updated_content, encoding="utf-8")
+            # Write updated content back, skipping no-op updates
+            if updated_content != current_content:
+                _write_atomic(readme_path, updated_content)
+                _readme_cache[str(readme_path)] = (
+                    readme_path.stat().st_mtime_ns, updated_content)
 
     except Exception as e:
         print(f"⚠️  Warning: Could not update project README.md: {e}")
 
 
+def _write_atomic(path: Path, content: str) -> None:
+    """
+    Replace a file's content in a single buffered write via a temporary file.
+
+    Readers see either the old or the new content, never a partial write.
+
+    Args:
+        path (Path): File to write
+        content (str): New file content
+    """
+    tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb", buffering=_WRITE_BUFFER_BYTES) as f:
+            f.write(content.encode("utf-8"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _readme_lock(readme_path: Path) -> threading.Lock:
+    """Get the lock guarding updates to a README file."""
+    with _readme_locks_guard:
+        return _readme_locks.setdefault(str(readme_path), threading.Lock())
+
+
+def update_readmes_batch(project_path: str, agent_name: str, agent_response: str) -> None:
+    """
+    Update the agent staging README and the project README from one agent response.
+
+    The response is parsed once for both updates, and each README is read and
+    written at most once.
+
+    Args:
+        project_path (str): Path to the project folder
+        agent_name (str): Name of the agent (e.g., "business_analyst")
+        agent_response (str): JSON response from the agent
+    """
+    response_data = _parse_agent_response(agent_response)
+    _update_staging_readme(project_path, agent_name, response_data)
+    _update_project_readme(project_path, agent_name, response_data)
+
+
+def update_readmes_in_background(project_path: str, agent_name: str, agent_response: str) -> Future:
+    """
+    Update the agent staging README and the project README in the background.
+
+    Both updates run as one update_readmes_batch task on a shared pool, so the
+    response is parsed once. Pending updates still complete at interpreter
+    exit, so callers only need to wait on the returned future if they read
+    the READMEs themselves.
+
+    Args:
+        project_path (str): Path to the project folder
+        agent_name (str): Name of the agent (e.g., "business_analyst")
+        agent_response (str): JSON response from the agent
+
+    Returns:
+        Future: Future for the batched README update
+    """
+    return _README_POOL.submit(update_readmes_batch,
+                               project_path, agent_name, agent_response)
+
+
+def _read_project_readme(readme_path: Path) -> str:
+    """
+    Read a project README, reusing the last written content if the file is unchanged.
+
+    Args:
+        readme_path (Path): Path to the project README.md
+
+    Returns:
+        str: Current README content
+    """
+    key = str(readme_path)
+    mtime_ns = readme_path.stat().st_mtime_ns
+    cached = _readme_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    content = readme_path.read_text(encoding="utf-8")
+    _readme_cache[key] = (mtime_ns, content)
+    return content
+
+
 def _generate_agent_progress_entry(agent_name: str, response_data: Dict) -> str:
     """Generate progress entry for an agent."""
 
-    agent_display_name = agent_name.replace('_', ' ').title()
+    agent_display_name = _display_name(agent_name)
     status = response_data.get('status', 'completed')
     summary = response_data.get('summary', 'Agent completed its tasks.')
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
@@ -595,83 +863,58 @@ def _generate_agent_progress_entry(agent_name: str, response_data: Dict) -> str:
     file_count = len(generated_files)
 
     # Get key deliverables
-    deliverables = []
-    for file_info in generated_files:
-        file_name = file_info.get('file_name', 'Unknown file')
-        deliverables.append(file_name)
+    deliverables = [file_info.get('file_name', 'Unknown file')
+                    for file_info in generated_files]
 
     # Status emoji
     status_emoji = "✅" if status == "completed" else "🔄"
 
-    progress_entry = f"""### {status_emoji} {agent_display_name}
+    parts = [f"""### {status_emoji} {agent_display_name}
 
 **Status:** {status.upper()} | **Updated:** {timestamp}
 
 {summary}
 
 **Generated Files:** {file_count} files
-"""
+"""]
 
     if deliverables:
-        progress_entry += f"**Key Deliverables:** {', '.join(deliverables[:3])}"
+        parts.append(f"**Key Deliverables:** {', '.join(deliverables[:3])}")
         if len(deliverables) > 3:
-            progress_entry += f" and {len(deliverables) - 3} more"
-        progress_entry += "\n"
+            parts.append(f" and {len(deliverables) - 3} more")
+        parts.append("\n")
 
-    progress_entry += f"**Details:** See `staging/{agent_name}/README.md`\n\n"
+    parts.append(f"**Details:** See `staging/{agent_name}/README.md`\n\n")
 
-    return progress_entry
+    return "".join(parts)
 
 
 def _update_project_readme_progress(current_content: str, agent_name: str, agent_progress: str) -> str:
     """Update project README with agent progress."""
 
-    # Find the progress markers
-    start_marker = "<!-- AGENT_PROGRESS_START -->"
-    end_marker = "<!-- AGENT_PROGRESS_END -->"
+    # Split around the progress markers
+    prefix, start_marker, rest = current_content.partition(_PROGRESS_START)
+    progress_content, end_marker, suffix = rest.partition(_PROGRESS_END)
 
-    start_idx = current_content.find(start_marker)
-    end_idx = current_content.find(end_marker)
-
-    if start_idx == -1 or end_idx == -1:
+    if not start_marker or not end_marker:
         # Markers not found, append at the end
         return current_content + "\n\n" + agent_progress
 
-    # Extract current progress section
-    progress_start = start_idx + len(start_marker)
-    progress_content = current_content[progress_start:end_idx]
-
-    # Check if agent progress already exists
-    agent_header = f"### ✅ {agent_name.replace('_', ' ').title()}"
-    agent_header_alt = f"### 🔄 {agent_name.replace('_', ' ').title()}"
-
-    if agent_header in progress_content or agent_header_alt in progress_content:
-        # Replace existing agent progress
-        lines = progress_content.split('\n')
-        new_lines = []
-        skip_section = False
-
-        for line in lines:
-            if (line.startswith(f"### ✅ {agent_name.replace('_', ' ').title()}") or
-                    line.startswith(f"### 🔄 {agent_name.replace('_', ' ').title()}")):
-                skip_section = True
-                new_lines.append(agent_progress.strip())
-            elif line.startswith("### ") and skip_section:
-                skip_section = False
-                new_lines.append(line)
-            elif not skip_section:
-                new_lines.append(line)
-
-        new_progress_content = '\n'.join(new_lines)
-    else:
-        # Add new agent progress
-        new_progress_content = progress_content + '\n' + agent_progress
-
-    # Reconstruct the content
-    updated_content = (
-        current_content[:progress_start] +
-        new_progress_content +
-        current_content[end_idx:]
-    )
+    # Replace the agent's existing section, or add a new one
+    new_progress_content, replaced = _agent_section_re(agent_name).subn(
+        lambda _: agent_progress.strip() + "\n", progress_content, count=1)
+    if not replaced:
+        new_progress_content = progress_content + "\n" + agent_progress
+
+    return "".join((prefix, start_marker, new_progress_content, end_marker, suffix))
+
 
-    return updated_content
+def _agent_section_re(agent_name: str) -> "re.Pattern[str]":
+    """Get the compiled pattern matching an agent's progress section, up to the next header."""
+    pattern = _AGENT_SECTION_RE_CACHE.get(agent_name)
+    if pattern is None:
+        display_name = re.escape(_display_name(agent_name))
+        pattern = re.compile(
+            rf"^### [✅🔄] {display_name}\n.*?(?=^### |\Z)", re.M | re.S)
+        _AGENT_SECTION_RE_CACHE[agent_name] = pattern
+    return pattern
@@ -0,0 +1,132 @@
+"""
+Shared agent construction and work functions for the worker agent tools.
+"""
+from functools import partial
+from typing import AsyncIterator, Callable, NamedTuple, Optional
+
+from strands import Agent
+
+# Sets BYPASS_TOOL_CONSENT before any agent uses strands_tools
+import tools._common  # noqa: F401
+from context_manager import get_condensed_context, get_system_prompt_content
+from tools._bedrock import (create_bedrock_model, is_warming_enabled,
+                            keep_prompt_cache_warm)
+from tools._errors import format_tool_error
+from tools._llm_cache import cache_response, get_cached_response
+from tools._streaming import batch_text_deltas
+
+
+class AgentTool(NamedTuple):
+    """The agent factory and work functions of one worker role."""
+    create_agent: Callable[[str], Agent]
+    work: Callable[..., str]
+    work_async: Callable[..., object]
+    work_stream: Callable[..., AsyncIterator[str]]
+
+
+def make_agent_tool(role: str, model_id: str, tool_name: Optional[str] = None) -> AgentTool:
+    """
+    Build the agent factory and work functions for a worker role.
+
+    Every role shares the same model construction (prompt caching, latency
+    config, shared boto3 session), response cache, lazy strands_tools import
+    and error formatting. Agents are created fresh per call, since they keep
+    conversation history.
+
+    Args:
+        role: Role name, used for the context files and the response cache
+        model_id: Bedrock model ID for the role
+        tool_name: Name used in error messages, defaults to "<role> tool"
+
+    Returns:
+        The role's create_agent, work, work_async and work_stream functions
+    """
+    tool_name = tool_name or f"{role.replace('_', ' ')} tool"
+
+    def build_agent(system_prompt: str) -> Agent:
+        # Shared model using latency-optimized inference where supported
+        bedrock_model = create_bedrock_model(model_id)
+
+        # strands_tools is only imported once an agent is actually needed
+        from strands_tools import file_read, file_write
+
+        # Create agent with appropriate context, cached when long enough
+        return Agent(model=bedrock_model,
+                     system_prompt=get_system_prompt_content(system_prompt),
+                     tools=[file_read, file_write])
+
+    def create_agent(complexity_level: str) -> Agent:
+        # Get context based on complexity level
+        system_prompt = get_condensed_context(role, complexity_level)
+
+        # Keep the prompt warm in Bedrock's prompt cache while the role is in
+        # use, when STRANDS_WARM=1
+        if is_warming_enabled():
+            keep_prompt_cache_warm(f"{role}:{complexity_level}", system_prompt,
+                                   partial(build_agent, system_prompt))
+
+        return build_agent(system_prompt)
+
+    def work(input_text: str, complexity_level: str = "SIMPLE") -> str:
+        cached = get_cached_response(role, model_id, complexity_level, input_text)
+        if cached is not None:
+            return cached
+
+        try:
+            response = create_agent(complexity_level)(input_text)
+        except Exception as e:
+            return format_tool_error(tool_name, e)
+
+        # Outside the try, so a cache failure never replaces a good response
+        cache_response(role, model_id, complexity_level, input_text, response)
+        return response
+
+    async def work_async(input_text: str, complexity_level: str = "SIMPLE") -> str:
+        cached = get_cached_response(role, model_id, complexity_level, input_text)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await create_agent(complexity_level).invoke_async(input_text)
+        except Exception as e:
+            return format_tool_error(tool_name, e)
+
+        # Outside the try, so a cache failure never replaces a good response
+        cache_response(role, model_id, complexity_level, input_text, response)
+        return response
+
+    async def work_stream(input_text: str, complexity_level: str = "SIMPLE") -> AsyncIterator[str]:
+        cached = get_cached_response(role, model_id, complexity_level, input_text)
+        if cached is not None:
+            yield cached
+            return
+
+        # The deltas include text from every event loop cycle, e.g. around tool
+        # calls, so cache the final AgentResult like work does, not the chunks
+        results = []
+
+        async def events(agent: Agent) -> AsyncIterator[dict]:
+            async for event in agent.stream_async(input_text):
+                if "result" in event:
+                    results.append(event["result"])
+                yield event
+
+        try:
+            async for chunk in batch_text_deltas(events(create_agent(complexity_level))):
+                yield chunk
+        except Exception as e:
+            yield format_tool_error(tool_name, e)
+            return
+
+        if results:
+            cache_response(role, model_id, complexity_level, input_text, results[-1])
+
+    create_agent.__doc__ = f"Create a {role} agent with context for the given complexity level."
+    work.__doc__ = f"Run the {role} agent on input_text and return its response."
+    work_async.__doc__ = f"Async variant of {role}_work for running several agents concurrently."
+    work_stream.__doc__ = (f"Streaming variant of {role}_work; yields the response in "
+                           "time-batched chunks as it is generated.")
+    for fn, suffix in ((work, "_work"), (work_async, "_work_async"), (work_stream, "_work_stream")):
+        fn.__name__ = fn.__qualname__ = role + suffix
+
+    return AgentTool(create_agent, work, work_async, work_stream)
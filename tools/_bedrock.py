@@ -0,0 +1,167 @@
+"""
+Shared Bedrock model construction for the worker agent tools.
+"""
+import logging
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict
+
+import boto3
+from botocore.config import Config
+from strands import Agent
+from strands.models import BedrockModel
+
+from constants import LATENCY_OPTIMIZED_MODELS
+from context_manager import is_cacheable
+
+logger = logging.getLogger(__name__)
+
+# One session and client config shared by every worker agent model, so
+# credentials and region are resolved once and connections can be pooled
+_SHARED_SESSION = boto3.Session()
+_SHARED_CFG = Config(
+    max_pool_connections=32,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+    read_timeout=120,
+)
+
+# Creating clients from a shared boto3 session is not thread-safe
+_session_lock = threading.Lock()
+
+# bedrock-runtime client of the first model created, reused by all later models.
+# Models are never evicted from create_bedrock_model's cache, so each model ID
+# builds (and discards) its own client only once per process.
+_shared_client = None
+
+# Bedrock keeps cached prompt prefixes for 5 minutes; refresh a little earlier
+_WARM_INTERVAL_SECONDS = 240
+
+# Stop refreshing a prompt once it has gone this long without a real request
+_WARM_IDLE_SECONDS = 900
+
+# Time of the last real request per warmed prompt; a key is present while its
+# refresh timer is armed
+_warm_last_used: Dict[str, float] = {}
+_warm_lock = threading.Lock()
+
+
+def get_latency_config(model_id: str) -> Dict[str, Any]:
+    """
+    Get BedrockModel settings that request latency-optimized inference.
+
+    Args:
+        model_id: Bedrock model ID
+
+    Returns:
+        Request arguments enabling optimized latency, or {} if the model does not support it
+    """
+    if model_id in LATENCY_OPTIMIZED_MODELS:
+        return {"additional_args": {"performanceConfig": {"latency": "optimized"}}}
+    return {}
+
+
+# Unbounded: keyed by model ID only, so there is one entry per distinct worker
+# model and nothing is ever evicted and rebuilt
+@lru_cache(maxsize=None)
+def create_bedrock_model(model_id: str) -> BedrockModel:
+    """
+    Create the Bedrock model used by worker agents, once per model ID.
+
+    Latency-optimized inference is requested for models that support it. All
+    models share one Bedrock client. Prompt caching is set on the agent's
+    system prompt blocks (see get_system_prompt_content), so one model serves
+    every prompt. Only the model is shared - callers still create a fresh
+    Agent per call, since agents keep conversation history.
+
+    Args:
+        model_id: Bedrock model ID
+
+    Returns:
+        Configured BedrockModel
+    """
+    global _shared_client
+    with _session_lock:
+        model = BedrockModel(
+            model_id=model_id,
+            temperature=0.2,
+            top_p=0.8,
+            boto_session=_SHARED_SESSION,
+            boto_client_config=_SHARED_CFG,
+            **get_latency_config(model_id)
+        )
+        # Every model uses the same session, region and client config, so they
+        # can share one client and keep its pooled connections warm
+        if _shared_client is None:
+            _shared_client = model.client
+        else:
+            model.client = _shared_client
+        return model
+
+
+def is_warming_enabled() -> bool:
+    """Check whether prompt cache warming is turned on (STRANDS_WARM=1)."""
+    return os.environ.get("STRANDS_WARM") == "1"
+
+
+def warm_prompt_cache(agent: Agent) -> None:
+    """
+    Send a one-token request so Bedrock caches the agent's system prompt.
+
+    The request uses the agent's model, system prompt and tool specs, so it
+    builds the same cached prefix as the agent's real requests.
+
+    Args:
+        agent: Agent whose prompt prefix should be cached
+    """
+    request = agent.model.format_request(
+        messages=[{"role": "user", "content": [{"text": "ping"}]}],
+        tool_specs=agent.tool_registry.get_all_tool_specs(),
+        system_prompt_content=agent.system_prompt_content,
+    )
+    request.setdefault("inferenceConfig", {})["maxTokens"] = 1
+    agent.model.client.converse(**request)
+
+
+def keep_prompt_cache_warm(key: str, system_prompt: str, make_agent: Callable[[], Agent]) -> None:
+    """
+    Record a real request for a prompt and keep it in Bedrock's prompt cache while in use.
+
+    The first request for a key arms a refresh timer; the request itself has
+    just written the cache. Each refresh re-sends the prompt prefix, and the
+    timer stops re-arming once the key has been idle for _WARM_IDLE_SECONDS.
+    Prompts below the caching minimum are skipped.
+
+    Args:
+        key: Identifies the prompt, e.g. "<role>:<complexity>"
+        system_prompt: The prompt's text, used to check it is cacheable
+        make_agent: Builds an agent with the prompt, called when a refresh is due
+    """
+    if not is_cacheable(system_prompt):
+        return
+
+    with _warm_lock:
+        armed = key in _warm_last_used
+        _warm_last_used[key] = time.monotonic()
+    if armed:
+        return
+
+    def refresh() -> None:
+        with _warm_lock:
+            if time.monotonic() - _warm_last_used[key] > _WARM_IDLE_SECONDS:
+                del _warm_last_used[key]
+                return
+        try:
+            warm_prompt_cache(make_agent())
+        except Exception as e:
+            logger.warning("prompt cache warm-up failed: %s", e)
+        schedule()
+
+    def schedule() -> None:
+        timer = threading.Timer(_WARM_INTERVAL_SECONDS, refresh)
+        timer.daemon = True
+        timer.start()
+
+    schedule()
@@ -0,0 +1,26 @@
+"""
+Settings and prompt helpers shared by the worker agent tool modules.
+"""
+import os
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+# Let agents use file_write without an interactive confirmation prompt,
+# unless the environment already says otherwise
+os.environ.setdefault("BYPASS_TOOL_CONSENT", "true")
+
+# Directory of the tool modules, for relative paths
+SCRIPT_DIR = Path(__file__).parent
+
+
+def format_optional_fields(fields: Iterable[Tuple[str, Optional[str]]]) -> str:
+    """
+    Format optional tool inputs as "Label: value" lines for an agent prompt.
+
+    Args:
+        fields: (label, value) pairs in a fixed order; empty values are skipped
+
+    Returns:
+        Newline-separated field lines
+    """
+    return "\n".join(f"{label}: {value}" for label, value in fields if value)
@@ -0,0 +1,30 @@
+"""
+Error reporting shared by the worker agent tools.
+"""
+
+# Error message prefixes by exception type, checked in order with isinstance so
+# subclasses (e.g. JSONDecodeError, ModuleNotFoundError) keep their category
+_ERROR_PREFIXES = (
+    (ValueError, "Input value error in"),
+    (RuntimeError, "Runtime error in"),
+    (ImportError, "Import error in"),
+)
+
+
+def format_tool_error(tool_name: str, error: Exception) -> str:
+    """
+    Format an exception raised by a worker agent as the tool's error response.
+
+    Args:
+        tool_name: Tool name used in the message, e.g. "developer tool"
+        error: Exception raised while running the agent
+
+    Returns:
+        Error message returned to the caller instead of the agent response
+    """
+    for error_type, prefix in _ERROR_PREFIXES:
+        if isinstance(error, error_type):
+            return f"{prefix} {tool_name}: {error}"
+    # Name the type of uncategorized errors (ClientError, TimeoutError, ...),
+    # whose messages are often ambiguous or empty on their own
+    return f"An unexpected error occurred in {tool_name}: {type(error).__name__}: {error}"
@@ -0,0 +1,159 @@
+"""
+Opt-in response cache for worker agent calls.
+
+Enabled with AGENT_CACHE=1, for test harnesses and reruns that repeat the same
+request. A cache hit skips the agent entirely, including any files it would
+have written, so leave it disabled for normal project work. Set AGENT_CACHE_DB
+to a file path to keep responses in SQLite across runs instead of in memory.
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached response stays valid
+CACHE_TTL_SECONDS = float(os.environ.get("AGENT_CACHE_TTL", "3600"))
+
+# Maximum number of responses kept in memory
+CACHE_MAX_ENTRIES = 128
+
+
+class MemoryBackend:
+    """In-process LRU store of (expiry time, response) entries."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, response: str, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+class DiskBackend:
+    """SQLite store of responses with the same LRU and TTL rules, shared across runs."""
+
+    def __init__(self, path: str, max_entries: int = CACHE_MAX_ENTRIES):
+        self._path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened on first use (with the lock held), so a disabled cache never creates the file
+        if self._conn is None:
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, expires REAL, used REAL, response TEXT)")
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        # Wall-clock time, since entries outlive the process
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                row = conn.execute(
+                    "SELECT expires, response FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                if row[0] < now:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                conn.execute("UPDATE responses SET used = ? WHERE key = ?", (now, key))
+                return row[1]
+
+    def set(self, key: str, response: str, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (key, now + ttl, now, response))
+                conn.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY used DESC LIMIT ?)",
+                    (self._max_entries,))
+
+
+_db_path = os.environ.get("AGENT_CACHE_DB")
+_backend = DiskBackend(_db_path) if _db_path else MemoryBackend()
+
+
+def is_enabled() -> bool:
+    """Check whether agent response caching is turned on."""
+    return os.environ.get("AGENT_CACHE") == "1"
+
+
+def make_key(role: str, model_id: str, complexity_level: str, input_text: str) -> str:
+    """Build the cache key for an agent request."""
+    payload = "\0".join((role, model_id, complexity_level, input_text)).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def get_cached_response(role: str, model_id: str, complexity_level: str, input_text: str) -> Optional[str]:
+    """
+    Look up a cached agent response.
+
+    Args:
+        role: Agent type (business_analyst, developer, etc.)
+        model_id: Bedrock model ID the request is sent to
+        complexity_level: SIMPLE, MODERATE, or COMPLEX
+        input_text: Request sent to the agent
+
+    Returns:
+        Cached response, or None on a miss or when caching is disabled
+    """
+    if not is_enabled():
+        return None
+    try:
+        return _backend.get(make_key(role, model_id, complexity_level, input_text))
+    except Exception as e:
+        # A broken or locked cache must not fail the tool; treat it as a miss
+        logger.warning("agent cache lookup failed: %s", e)
+        return None
+
+
+def cache_response(role: str, model_id: str, complexity_level: str, input_text: str,
+                   response: object) -> None:
+    """
+    Store a successful agent response when caching is enabled.
+
+    Args:
+        role: Agent type (business_analyst, developer, etc.)
+        model_id: Bedrock model ID the request is sent to
+        complexity_level: SIMPLE, MODERATE, or COMPLEX
+        input_text: Request sent to the agent
+        response: Agent response (AgentResult or str), stored as text
+    """
+    if not is_enabled():
+        return
+    try:
+        _backend.set(make_key(role, model_id, complexity_level, input_text),
+                     str(response), CACHE_TTL_SECONDS)
+    except Exception as e:
+        # The response is still returned to the caller, just not cached
+        logger.warning("agent cache store failed: %s", e)
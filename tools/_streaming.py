@@ -0,0 +1,39 @@
+"""
+Streaming helpers shared by the worker agent tools.
+"""
+import time
+from typing import Any, AsyncIterator, Dict, List
+
+# How long to collect text deltas before emitting them as one chunk
+STREAM_BATCH_SECONDS = 0.15
+
+
+async def batch_text_deltas(events: AsyncIterator[Dict[str, Any]],
+                            window: float = STREAM_BATCH_SECONDS) -> AsyncIterator[str]:
+    """
+    Collect the text deltas of an agent event stream into time-windowed chunks.
+
+    Forwarding every token separately makes consumers pay per-token overhead;
+    batching keeps latency within the window while cutting the number of chunks.
+
+    Args:
+        events: Events from Agent.stream_async
+        window: Seconds to collect deltas before emitting a chunk
+
+    Yields:
+        Concatenated response text for each window
+    """
+    buffer: List[str] = []
+    flush_at = 0.0
+    async for event in events:
+        data = event.get("data")
+        if not data:
+            continue
+        if not buffer:
+            flush_at = time.monotonic() + window
+        buffer.append(data)
+        if time.monotonic() >= flush_at:
+            yield "".join(buffer)
+            buffer.clear()
+    if buffer:
+        yield "".join(buffer)
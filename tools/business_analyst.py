@@ -1,66 +1,121 @@
 """
 Implement a tool which provides the functions of a business analyst, i.e. gathering requirements and creating user stories.
 """
-import json
-import os
-from pathlib import Path
-from typing import Any, Dict, Optional
+import re
+import string
+from typing import Optional
 
-import boto3
-from strands import Agent, tool
-from strands.models import BedrockModel
-from strands_tools import file_read, file_write
+from strands import tool
 
 from constants import MODEL_BUSINESS_ANALYST
-from context_manager import get_condensed_context
-from project_utils import (update_agent_staging_readme,
-                           update_project_readme_with_agent_work)
+from project_utils import update_readmes_in_background
+from tools._agent_factory import make_agent_tool
+from tools._common import SCRIPT_DIR, format_optional_fields
 
-# Define the tools we need
-tools = [file_read, file_write]
+# Agent request template. The fixed instructions come first and the per-request
+# fields last, so requests share the longest possible identical prefix.
+_INPUT_TEMPLATE = string.Template("""
+BUSINESS ANALYSIS REQUEST:
+
+INSTRUCTIONS:
+1. Create business analysis files in docs/requirements/ folder
+2. Also create copies in staging/business_analyst/ for traceability
+3. Generate whatever files you think are necessary (e.g., user_stories.md, requirements.md, etc.)
+4. Each file should contain detailed, well-structured content
+5. Return a JSON response with the primary file locations (not staging paths)
+
+{
+  "status": "completed",
+  "summary": "Brief summary of the business analysis completed",
+  "generated_files": [
+    {
+      "file_path": "docs/requirements/filename.md",
+      "file_name": "filename.md", 
+      "content_description": "Description of what this file contains",
+      "key_insights": ["List", "of", "key", "insights", "from", "this", "file"]
+    }
+  ],
+  "recommendations": ["Key", "recommendations", "from", "the", "analysis"],
+  "downstream_inputs": {
+    "complexity_level": "Project complexity assessment (SIMPLE/MODERATE/COMPLEX)",
+    "software_architect": {
+      "requirements": "Consolidated business requirements for architecture design",
+      "complexity_level": "Project complexity assessment (SIMPLE/MODERATE/COMPLEX)",
+      "performance_requirements": "Performance criteria and benchmarks",
+      "security_requirements": "Security constraints and compliance needs",
+      "integration_requirements": "External system integration requirements",
+      "scalability_requirements": "Scalability and load requirements",
+      "compliance_requirements": "Regulatory and compliance requirements"
+    },
+    "ui_designer": {
+      "user_requirements": "User stories and functional requirements",
+      "complexity_level": "Project complexity assessment (SIMPLE/MODERATE/COMPLEX)",
+      "user_personas": "Target audience and user personas",
+      "accessibility_requirements": "Accessibility standards and requirements",
+      "content_structure": "Content structure and information architecture"
+    }
+  }
+}
+
+Expected deliverables:
+- docs/requirements/complexity_assessment.md - Project complexity analysis
+- docs/requirements/functional_specification.md - SDD functional specification blueprint
+- docs/requirements/user_stories.md - User stories with acceptance criteria
+- docs/requirements/requirements.md - Functional and non-functional requirements
+- Additional files based on complexity: stakeholder_analysis.md, risk_assessment.md, business_processes.md, success_metrics.md
+- staging/business_analyst/ - Working copies of all files for traceability
+
+Project Path: $project_path
+Requirements Location: $project_path/docs/requirements/
+Staging Folder: $project_path/staging/business_analyst/
+
+Project Description: $project_description
+$optional_fields
+""")
+
+# Keywords that indicate project complexity, matched at the start of a word
+# so "apps" and "systems" count but "happy" does not
+_MODERATE_KEYWORDS = frozenset({"application", "app", "system", "multiple", "integration"})
+_COMPLEX_KEYWORDS = frozenset({"enterprise", "platform", "architecture", "microservices",
+                               "distributed", "scalable", "large-scale", "complex"})
 
-os.environ["BYPASS_TOOL_CONSENT"] = "true"
 
-# Script directory for relative paths
-script_dir = Path(__file__).parent
+def _alternation(keywords: frozenset) -> str:
+    """Join keywords into a regex alternation."""
+    return "|".join(map(re.escape, sorted(keywords)))
 
 
-def business_analyst_work(input_text: str, complexity_level: str = "SIMPLE") -> str:
+# Both tiers in one pattern, so the description is scanned once
+_COMPLEXITY_RE = re.compile(
+    r"\b(?:(?P<complex>" + _alternation(_COMPLEX_KEYWORDS) + ")"
+    r"|(?P<moderate>" + _alternation(_MODERATE_KEYWORDS) + "))")
+
+
+def _detect_complexity(project_description: str) -> str:
     """
-    Business analyst work function that processes input text and returns the agent's response.
+    Estimate project complexity from keywords in the description.
 
     Args:
-        input_text (str): The input text containing business requirements or specifications
-        complexity_level (str): Project complexity level (SIMPLE, MODERATE, COMPLEX)
+        project_description (str): Main project description
 
     Returns:
-        str: The agent's response including analysis and recommendations
+        str: COMPLEX if any complex keyword is present, else MODERATE if any
+            moderate keyword is present, else SIMPLE
     """
-    try:
-        bedrock_model = BedrockModel(
-            model_id=MODEL_BUSINESS_ANALYST,
-            temperature=0.2,
-            top_p=0.8
-        )
+    complexity_level = "SIMPLE"  # Default
+    for match in _COMPLEXITY_RE.finditer(project_description.lower()):
+        if match.lastgroup == "complex":
+            return "COMPLEX"
+        complexity_level = "MODERATE"
+    return complexity_level
 
-        # Get context based on complexity level
-        system_prompt = get_condensed_context(
-            "business_analyst", complexity_level)
-
-        # Create agent with appropriate context
-        agent = Agent(model=bedrock_model,
-                      system_prompt=system_prompt, tools=tools)
-
-        response = agent(input_text)
-        return response
-    except ValueError as e:
-        return f"Input value error in business analyst tool: {str(e)}"
-    except RuntimeError as e:
-        return f"Runtime error in business analyst tool: {str(e)}"
-    except ImportError as e:
-        return f"Import error in business analyst tool: {str(e)}"
-    except Exception as e:
-        return f"An unexpected error occurred in business analyst tool: {str(e)}"
+
+# Agent construction, response caching, streaming and error handling are
+# shared by all worker roles
+_agent_tool = make_agent_tool("business_analyst", MODEL_BUSINESS_ANALYST)
+business_analyst_work = _agent_tool.work
+business_analyst_work_async = _agent_tool.work_async
+business_analyst_work_stream = _agent_tool.work_stream
 
 
 @tool
@@ -103,104 +158,28 @@ def business_analyst_tool(
         str: JSON response with list of generated files and their descriptions
     """
     # Convert to formatted string for the agent
-    input_text = f"""
-BUSINESS ANALYSIS REQUEST:
-
-Project Path: {project_path}
-Requirements Location: {project_path}/docs/requirements/
-Staging Folder: {project_path}/staging/business_analyst/
-
-Project Description: {project_description}
-
-{f'Stakeholders: {stakeholders}' if stakeholders else ''}
-{f'Business Objectives: {business_objectives}' if business_objectives else ''}
-{f'Target Users: {target_users}' if target_users else ''}
-{f'Constraints: {constraints}' if constraints else ''}
-{f'Timeline: {timeline}' if timeline else ''}
-{f'Budget: {budget}' if budget else ''}
-{f'Market Context: {market_context}' if market_context else ''}
-
-INSTRUCTIONS:
-1. Create business analysis files in docs/requirements/ folder
-2. Also create copies in staging/business_analyst/ for traceability
-3. Generate whatever files you think are necessary (e.g., user_stories.md, requirements.md, etc.)
-4. Each file should contain detailed, well-structured content
-5. Return a JSON response with the primary file locations (not staging paths)
-
-{{
-  "status": "completed",
-  "summary": "Brief summary of the business analysis completed",
-  "generated_files": [
-    {{
-      "file_path": "docs/requirements/filename.md",
-      "file_name": "filename.md", 
-      "content_description": "Description of what this file contains",
-      "key_insights": ["List", "of", "key", "insights", "from", "this", "file"]
-    }}
-  ],
-  "recommendations": ["Key", "recommendations", "from", "the", "analysis"],
-  "downstream_inputs": {{
-    "complexity_level": "Project complexity assessment (SIMPLE/MODERATE/COMPLEX)",
-    "software_architect": {{
-      "requirements": "Consolidated business requirements for architecture design",
-      "complexity_level": "Project complexity assessment (SIMPLE/MODERATE/COMPLEX)",
-      "performance_requirements": "Performance criteria and benchmarks",
-      "security_requirements": "Security constraints and compliance needs",
-      "integration_requirements": "External system integration requirements",
-      "scalability_requirements": "Scalability and load requirements",
-      "compliance_requirements": "Regulatory and compliance requirements"
-    }},
-    "ui_designer": {{
-      "user_requirements": "User stories and functional requirements",
-      "complexity_level": "Project complexity assessment (SIMPLE/MODERATE/COMPLEX)",
-      "user_personas": "Target audience and user personas",
-      "accessibility_requirements": "Accessibility standards and requirements",
-      "content_structure": "Content structure and information architecture"
-    }}
-  }}
-}}
-
-Expected deliverables:
-- docs/requirements/complexity_assessment.md - Project complexity analysis
-- docs/requirements/functional_specification.md - SDD functional specification blueprint
-- docs/requirements/user_stories.md - User stories with acceptance criteria
-- docs/requirements/requirements.md - Functional and non-functional requirements
-- Additional files based on complexity: stakeholder_analysis.md, risk_assessment.md, business_processes.md, success_metrics.md
-- staging/business_analyst/ - Working copies of all files for traceability
-"""
+    input_text = _INPUT_TEMPLATE.substitute(
+        project_path=project_path,
+        project_description=project_description,
+        optional_fields=format_optional_fields((
+            ("Stakeholders", stakeholders),
+            ("Business Objectives", business_objectives),
+            ("Target Users", target_users),
+            ("Constraints", constraints),
+            ("Timeline", timeline),
+            ("Budget", budget),
+            ("Market Context", market_context)
+        ))
+    )
 
     # Determine complexity level based on project description
     # Simple heuristic: check for keywords that indicate complexity
-    complexity_keywords = {
-        "SIMPLE": ["function", "utility", "small", "simple", "basic", "single"],
-        "MODERATE": ["application", "app", "system", "multiple", "integration"],
-        "COMPLEX": ["enterprise", "platform", "architecture", "microservices", "distributed", "scalable", "large-scale", "complex"]
-    }
-
-    complexity_level = "SIMPLE"  # Default
-    description_lower = project_description.lower()
-
-    # Check for complex keywords first
-    for keyword in complexity_keywords["COMPLEX"]:
-        if keyword in description_lower:
-            complexity_level = "COMPLEX"
-            break
-
-    # If not complex, check for moderate keywords
-    if complexity_level == "SIMPLE":
-        for keyword in complexity_keywords["MODERATE"]:
-            if keyword in description_lower:
-                complexity_level = "MODERATE"
-                break
+    complexity_level = _detect_complexity(project_description)
 
     result = business_analyst_work(input_text.strip(), complexity_level)
 
-    # Update staging README with generated file information
-    update_agent_staging_readme(project_path, "business_analyst", result)
-
-    # Update main project README with agent work progress
-    update_project_readme_with_agent_work(
-        project_path, "business_analyst", result)
+    # Update staging and main project READMEs without blocking the caller
+    update_readmes_in_background(project_path, "business_analyst", result)
 
     return result
 
@@ -213,7 +192,7 @@ if __name__ == "__main__":
     try:
         result = business_analyst_tool(
             project_description="Build a web application for a small restaurant that allows customers to view menu, place orders, track status, and make payments. Restaurant owner needs to manage menu items and orders.",
-            project_path=script_dir.parent / "tmp",  # Test project path
+            project_path=SCRIPT_DIR.parent / "tmp",  # Test project path
             stakeholders="Restaurant owner, customers, delivery drivers, kitchen staff",
             business_objectives="Increase order volume by 30%, reduce order processing time, improve customer satisfaction",
             target_users="Local restaurant customers aged 25-65, tech-savvy diners, busy professionals",
@@ -1,63 +1,65 @@
 """
 Implement a tool which provides the functions of a code reviewer, i.e. reviewing code quality, security, performance, and best practices.
 """
-import os
-from pathlib import Path
+import string
 from typing import Optional
-from strands.models import BedrockModel
-from strands import Agent, tool
-from strands_tools import file_read, file_write
+from strands import tool
 from constants import MODEL_CODE_REVIEWER
-from project_utils import update_agent_staging_readme, update_project_readme_with_agent_work
-from context_manager import get_condensed_context
+from project_utils import update_readmes_in_background
+from tools._agent_factory import make_agent_tool
+from tools._common import format_optional_fields
 
-# Define the tools we need
-tools = [file_read, file_write]
-
-os.environ["BYPASS_TOOL_CONSENT"] = "true"
+# Agent request template. The fixed instructions come first and the per-request
+# fields last, so requests share the longest possible identical prefix.
+_INPUT_TEMPLATE = string.Template("""
+CODE REVIEW REQUEST:
 
-# Script directory for relative paths
-script_dir = Path(__file__).parent
+INSTRUCTIONS:
+1. Create review files in docs/reviews/ folder
+2. Also create copies in staging/code_reviewer/ folder for traceability
+3. Generate whatever files you think are necessary (review reports, security assessments, etc.)
+4. Each file should contain detailed, well-structured review content
+5. Return a JSON response with the primary file locations (not staging paths) using the following format:
 
+{
+  "status": "completed",
+  "summary": "Brief summary of the code review work completed",
+  "generated_files": [
+    {
+      "file_path": "docs/reviews/filename.md",
+      "file_name": "filename.md", 
+      "content_description": "Description of what this file contains",
+      "key_insights": ["List", "of", "key", "review", "findings"]
+    }
+  ],
+  "recommendations": ["Key", "improvement", "recommendations"]
+}
 
-def code_reviewer_work(input_text: str, complexity_level: str = "SIMPLE") -> str:
-    """
-    Code reviewer work function that processes input text and returns the agent's response.
+Expected deliverables:
+- Detailed code review feedback with line-by-line comments (docs/reviews/)
+- Security vulnerability assessment and remediation steps (docs/reviews/)
+- Performance analysis and optimization recommendations (docs/reviews/)
+- Code quality metrics and technical debt assessment (docs/reviews/)
+- Best practices compliance checklist (docs/reviews/)
+- Refactoring suggestions and improvement priorities (docs/reviews/)
+- Test coverage analysis and testing recommendations (docs/reviews/)
+- Documentation quality assessment and improvements (docs/reviews/)
 
-    Args:
-        input_text (str): The input text containing code to review or review specifications
-        complexity_level (str): Project complexity level (SIMPLE, MODERATE, COMPLEX)
+Project Path: $project_path
+Primary Output: $project_path/docs/reviews/
+Staging Folder: $project_path/staging/code_reviewer/
 
-    Returns:
-        str: The agent's response including code review feedback and recommendations
-    """
-    try:
+Code Review Request: $code_review_request
+$optional_fields
+""")
 
-        # Agent will be created dynamically based on complexity level
-        bedrock_model = BedrockModel(
-            model_id=MODEL_CODE_REVIEWER,
-            temperature=0.2,
-            top_p=0.8
-        )
 
-        # Get context based on complexity level
-        system_prompt = get_condensed_context(
-            "code_reviewer", complexity_level)
-
-        # Create agent with appropriate context
-        agent = Agent(model=bedrock_model,
-                      system_prompt=system_prompt, tools=tools)
-
-        response = agent(input_text)
-        return response
-    except ValueError as e:
-        return f"Input value error in code reviewer tool: {str(e)}"
-    except RuntimeError as e:
-        return f"Runtime error in code reviewer tool: {str(e)}"
-    except ImportError as e:
-        return f"Import error in code reviewer tool: {str(e)}"
-    except Exception as e:
-        return f"An unexpected error occurred in code reviewer tool: {str(e)}"
+# Agent construction, response caching, streaming and error handling are
+# shared by all worker roles
+_agent_tool = make_agent_tool("code_reviewer", MODEL_CODE_REVIEWER)
+code_reviewer_work = _agent_tool.work
+code_reviewer_work_async = _agent_tool.work_async
+code_reviewer_work_stream = _agent_tool.work_stream
 
 
 @tool
@@ -100,65 +102,26 @@ def code_reviewer_tool(
         str: JSON response with list of generated files and their descriptions
     """
     # Construct structured input for the agent
-    input_text = f"""
-CODE REVIEW REQUEST:
-
-Project Path: {project_path}
-Primary Output: {project_path}/docs/reviews/
-Staging Folder: {project_path}/staging/code_reviewer/
-
-Code Review Request: {code_review_request}
-
-{f'Project Complexity Level: {complexity_level}' if complexity_level else ''}
-{f'Source Code Files: {source_code_files}' if source_code_files else ''}
-{f'Coding Standards: {coding_standards}' if coding_standards else ''}
-{f'Security Requirements: {security_requirements}' if security_requirements else ''}
-{f'Performance Criteria: {performance_criteria}' if performance_criteria else ''}
-{f'Architecture Guidelines: {architecture_guidelines}' if architecture_guidelines else ''}
-{f'Test Coverage Requirements: {test_coverage_requirements}' if test_coverage_requirements else ''}
-
-INSTRUCTIONS:
-1. Create review files in docs/reviews/ folder
-2. Also create copies in staging/code_reviewer/ folder for traceability
-3. Generate whatever files you think are necessary (review reports, security assessments, etc.)
-4. Each file should contain detailed, well-structured review content
-5. Return a JSON response with the primary file locations (not staging paths) using the following format:
-
-{{
-  "status": "completed",
-  "summary": "Brief summary of the code review work completed",
-  "generated_files": [
-    {{
-      "file_path": "docs/reviews/filename.md",
-      "file_name": "filename.md", 
-      "content_description": "Description of what this file contains",
-      "key_insights": ["List", "of", "key", "review", "findings"]
-    }}
-  ],
-  "recommendations": ["Key", "improvement", "recommendations"]
-}}
-
-Expected deliverables:
-- Detailed code review feedback with line-by-line comments (docs/reviews/)
-- Security vulnerability assessment and remediation steps (docs/reviews/)
-- Performance analysis and optimization recommendations (docs/reviews/)
-- Code quality metrics and technical debt assessment (docs/reviews/)
-- Best practices compliance checklist (docs/reviews/)
-- Refactoring suggestions and improvement priorities (docs/reviews/)
-- Test coverage analysis and testing recommendations (docs/reviews/)
-- Documentation quality assessment and improvements (docs/reviews/)
-"""
+    input_text = _INPUT_TEMPLATE.substitute(
+        project_path=project_path,
+        code_review_request=code_review_request,
+        optional_fields=format_optional_fields((
+            ("Project Complexity Level", complexity_level),
+            ("Source Code Files", source_code_files),
+            ("Coding Standards", coding_standards),
+            ("Security Requirements", security_requirements),
+            ("Performance Criteria", performance_criteria),
+            ("Architecture Guidelines", architecture_guidelines),
+            ("Test Coverage Requirements", test_coverage_requirements)
+        ))
+    )
 
     # Use provided complexity level or default to SIMPLE
     comp_level = complexity_level if complexity_level else "SIMPLE"
     result = code_reviewer_work(input_text.strip(), comp_level)
 
-    # Update staging README with generated file information
-    update_agent_staging_readme(project_path, "code_reviewer", result)
-
-    # Update main project README with agent work progress
-    update_project_readme_with_agent_work(
-        project_path, "code_reviewer", result)
+    # Update staging and main project READMEs without blocking the caller
+    update_readmes_in_background(project_path, "code_reviewer", result)
 
     return result
 
@@ -1,64 +1,123 @@
 """
 Implement a tool which provides the functions of a developer, i.e. writing code according to the requirements in input.
 """
-import os
-# Fix imports to match project structure
-import os
-from pathlib import Path
-from typing import Optional
-from strands.models import BedrockModel
-from strands import Agent, tool
-from strands_tools import file_read, file_write
+import re
+import string
+from typing import Dict, List, Optional
+from strands import tool
 from constants import MODEL_DEVELOPER
-from project_utils import update_agent_staging_readme, update_project_readme_with_agent_work
-from context_manager import get_condensed_context
+from project_utils import update_readmes_in_background
+from tools._agent_factory import make_agent_tool
+from tools._common import SCRIPT_DIR, format_optional_fields
 
-# Define the tools we need
-tools = [file_read, file_write]
+# Fixed instructions, placed before the per-request fields so requests share
+# the longest possible identical prefix
+_INSTRUCTIONS = """DEVELOPMENT REQUEST:
 
+INSTRUCTIONS:
+1. Create source code files in src/app/ folder
+2. Create test files in src/tests/ folder 
+3. Create configuration files in src/config/ folder
+4. Create documentation files in docs/ folder
+5. Also create copies in staging/developer/ for traceability
+6. Return a JSON response with the primary file locations (not staging paths)
 
-os.environ["BYPASS_TOOL_CONSENT"] = "true"
+{
+  "status": "completed",
+  "summary": "Brief summary of the development work completed",
+  "generated_files": [
+    {
+      "file_path": "src/app/filename.py",
+      "file_name": "filename.py", 
+      "content_description": "Description of what this file contains",
+      "key_insights": ["List", "of", "key", "implementation", "decisions"]
+    }
+  ],
+  "recommendations": ["Key", "development", "recommendations"],
+  "downstream_inputs": {
+    "code_reviewer": {
+      "code_review_request": "Code review request and requirements",
+      "source_code_files": "Source code files and implementations to review",
+      "test_coverage_requirements": "Test coverage requirements and quality metrics"
+    },
+    "ui_tester": {
+      "application_urls": "Application URLs and testing environments",
+      "test_data": "Test data and regression testing requirements"
+    }
+  }
+}
 
-# Script directory for relative paths
-script_dir = Path(__file__).parent
+Expected deliverables:
+- src/app/ - Complete application source code
+- src/config/ - Configuration files and environment templates  
+- src/tests/ - Unit tests, integration tests, and test coverage reports
+- docs/README.md - Setup, installation, and deployment instructions
+- docs/dependencies.md - Dependency specifications and package management files
+- docs/api/api_documentation.md - API documentation and technical specifications
+- docs/implementation_notes.md - Implementation decisions and technical rationale
+- docs/performance_guide.md - Performance optimization recommendations
+- docs/security_implementation.md - Security implementation and best practices
+- docs/development_guide.md - Development setup and contribution guidelines
+- staging/developer/ - Working copies of all files for traceability"""
 
+# Per-request fields, appended after the instructions
+_REQUEST_TEMPLATE = string.Template("""Project Path: $project_path
+Source Code Location: $project_path/src/app/
+Tests Location: $project_path/src/tests/
+Config Location: $project_path/src/config/
+Documentation Location: $project_path/docs/
+Staging Folder: $project_path/staging/developer/
 
-def developer_work(input_text: str, complexity_level: str = "SIMPLE") -> str:
-    """
-    Developer work function that processes input text and returns the agent's response.
+Technical Specifications: $technical_specifications
+$optional_fields
+""")
 
-    Args:
-        input_text (str): The input text containing development requirements or specifications
-        complexity_level (str): Project complexity level (SIMPLE, MODERATE, COMPLEX)
+# Batch requests: instructions for answering several specifications at once,
+# and the pattern that splits the combined response per specification
+_BATCH_INSTRUCTIONS = """This request contains {count} independent specifications, each wrapped in <<<SPEC id=N>>> and <<<END>>> markers.
+Handle each specification separately and return one JSON response per specification, in the format above, wrapped as:
 
-    Returns:
-        str: The agent's response including code implementation and explanations
-    """
-    try:
+<<<OUT id=N>>>
+{{JSON response}}
+<<<END>>>"""
+_BATCH_OUTPUT_RE = re.compile(r"<<<OUT id=(\d+)>>>\s*(.*?)\s*<<<END>>>", re.S)
 
-        # Agent will be created dynamically based on complexity level
-        bedrock_model = BedrockModel(
-            model_id=MODEL_DEVELOPER,
-            temperature=0.2,
-            top_p=0.8
-        )
-        # Get context based on complexity level
-        system_prompt = get_condensed_context("developer", complexity_level)
 
-        # Create agent with appropriate context
-        agent = Agent(model=bedrock_model,
-                      system_prompt=system_prompt, tools=tools)
+# Agent construction, response caching, streaming and error handling are
+# shared by all worker roles
+_agent_tool = make_agent_tool("developer", MODEL_DEVELOPER)
+developer_work = _agent_tool.work
+developer_work_async = _agent_tool.work_async
+developer_work_stream = _agent_tool.work_stream
 
-        response = agent(input_text)
-        return response
-    except ValueError as e:
-        return f"Input value error in developer tool: {str(e)}"
-    except RuntimeError as e:
-        return f"Runtime error in developer tool: {str(e)}"
-    except ImportError as e:
-        return f"Import error in developer tool: {str(e)}"
-    except Exception as e:  # Fallback for unexpected errors
-        return f"An unexpected error occurred in developer tool: {str(e)}"
+
+def _format_request(
+    technical_specifications: str,
+    project_path: str,
+    complexity_level: Optional[str] = None,
+    architecture_guidelines: Optional[str] = None,
+    coding_requirements: Optional[str] = None,
+    technology_stack: Optional[str] = None,
+    file_structure: Optional[str] = None,
+    performance_requirements: Optional[str] = None,
+    testing_requirements: Optional[str] = None,
+    security_requirements: Optional[str] = None
+) -> str:
+    """Format the per-request fields of a developer request (see developer_tool)."""
+    return _REQUEST_TEMPLATE.substitute(
+        project_path=project_path,
+        technical_specifications=technical_specifications,
+        optional_fields=format_optional_fields((
+            ("Project Complexity Level", complexity_level),
+            ("Architecture Guidelines", architecture_guidelines),
+            ("Coding Requirements", coding_requirements),
+            ("Technology Stack", technology_stack),
+            ("File Structure", file_structure),
+            ("Performance Requirements", performance_requirements),
+            ("Testing Requirements", testing_requirements),
+            ("Security Requirements", security_requirements)
+        ))
+    ).strip()
 
 
 @tool
@@ -104,85 +163,60 @@ def developer_tool(
         str: JSON response with list of generated files and their descriptions
     """
     # Construct structured input for the agent
-    input_text = f"""
-DEVELOPMENT REQUEST:
-
-Project Path: {project_path}
-Source Code Location: {project_path}/src/app/
-Tests Location: {project_path}/src/tests/
-Config Location: {project_path}/src/config/
-Documentation Location: {project_path}/docs/
-Staging Folder: {project_path}/staging/developer/
-
-Technical Specifications: {technical_specifications}
-
-{f'Project Complexity Level: {complexity_level}' if complexity_level else ''}
-{f'Architecture Guidelines: {architecture_guidelines}' if architecture_guidelines else ''}
-{f'Coding Requirements: {coding_requirements}' if coding_requirements else ''}
-{f'Technology Stack: {technology_stack}' if technology_stack else ''}
-{f'File Structure: {file_structure}' if file_structure else ''}
-{f'Performance Requirements: {performance_requirements}' if performance_requirements else ''}
-{f'Testing Requirements: {testing_requirements}' if testing_requirements else ''}
-{f'Security Requirements: {security_requirements}' if security_requirements else ''}
+    input_text = _INSTRUCTIONS + "\n\n" + _format_request(
+        technical_specifications, project_path, complexity_level,
+        architecture_guidelines, coding_requirements, technology_stack,
+        file_structure, performance_requirements, testing_requirements,
+        security_requirements)
 
-INSTRUCTIONS:
-1. Create source code files in src/app/ folder
-2. Create test files in src/tests/ folder 
-3. Create configuration files in src/config/ folder
-4. Create documentation files in docs/ folder
-5. Also create copies in staging/developer/ for traceability
-6. Return a JSON response with the primary file locations (not staging paths)
+    # Use provided complexity level or default to SIMPLE
+    comp_level = complexity_level if complexity_level else "SIMPLE"
+    result = developer_work(input_text, comp_level)
 
-{{
-  "status": "completed",
-  "summary": "Brief summary of the development work completed",
-  "generated_files": [
-    {{
-      "file_path": "src/app/filename.py",
-      "file_name": "filename.py", 
-      "content_description": "Description of what this file contains",
-      "key_insights": ["List", "of", "key", "implementation", "decisions"]
-    }}
-  ],
-  "recommendations": ["Key", "development", "recommendations"],
-  "downstream_inputs": {{
-    "code_reviewer": {{
-      "code_review_request": "Code review request and requirements",
-      "source_code_files": "Source code files and implementations to review",
-      "test_coverage_requirements": "Test coverage requirements and quality metrics"
-    }},
-    "ui_tester": {{
-      "application_urls": "Application URLs and testing environments",
-      "test_data": "Test data and regression testing requirements"
-    }}
-  }}
-}}
+    # Update staging and main project READMEs without blocking the caller
+    update_readmes_in_background(project_path, "developer", result)
 
-Expected deliverables:
-- src/app/ - Complete application source code
-- src/config/ - Configuration files and environment templates  
-- src/tests/ - Unit tests, integration tests, and test coverage reports
-- docs/README.md - Setup, installation, and deployment instructions
-- docs/dependencies.md - Dependency specifications and package management files
-- docs/api/api_documentation.md - API documentation and technical specifications
-- docs/implementation_notes.md - Implementation decisions and technical rationale
-- docs/performance_guide.md - Performance optimization recommendations
-- docs/security_implementation.md - Security implementation and best practices
-- docs/development_guide.md - Development setup and contribution guidelines
-- staging/developer/ - Working copies of all files for traceability
-"""
+    return result
+
+
+def developer_tool_batch(specs: List[Dict[str, Optional[str]]], complexity_level: Optional[str] = None) -> List[str]:
+    """
+    Run several independent developer requests in a single agent call.
+
+    The instructions and system prompt are sent once for the whole batch, and the
+    combined response is split back into one response per specification.
+
+    Args:
+        specs (List[Dict[str, Optional[str]]]): developer_tool arguments for each request;
+            technical_specifications and project_path are required
+        complexity_level (Optional[str]): Project complexity level (SIMPLE/MODERATE/COMPLEX)
+
+    Returns:
+        List[str]: JSON response for each specification, in input order. If the agent
+            did not answer a specification, its entry is the full agent response.
+    """
+    sections = [_BATCH_INSTRUCTIONS.format(count=len(specs))]
+    for spec_id, spec in enumerate(specs, 1):
+        sections.append(f"<<<SPEC id={spec_id}>>>\n{_format_request(**spec)}\n<<<END>>>")
+    input_text = _INSTRUCTIONS + "\n\n" + "\n\n".join(sections)
 
     # Use provided complexity level or default to SIMPLE
     comp_level = complexity_level if complexity_level else "SIMPLE"
-    result = developer_work(input_text.strip(), comp_level)
+    response = str(developer_work(input_text, comp_level))
+    outputs = dict(_BATCH_OUTPUT_RE.findall(response))
 
-    # Update staging README with generated file information
-    update_agent_staging_readme(project_path, "developer", result)
+    results = []
+    for spec_id, spec in enumerate(specs, 1):
+        result = outputs.get(str(spec_id))
+        if result is None:
+            results.append(response)
+            continue
 
-    # Update main project README with agent work progress
-    update_project_readme_with_agent_work(project_path, "developer", result)
+        # Update staging and main project READMEs without blocking the caller
+        update_readmes_in_background(spec["project_path"], "developer", result)
+        results.append(result)
 
-    return result
+    return results
 
 
 if __name__ == "__main__":
@@ -226,7 +260,7 @@ if __name__ == "__main__":
     try:
         result = developer_tool(
             technical_specifications=test_input,
-            project_path=script_dir.parent / "tmp"
+            project_path=SCRIPT_DIR.parent / "tmp"
         )
         print(result)
     except Exception as e:
@@ -1,61 +1,65 @@
 """
 Implement a tool which provides the functions of a UI designer, i.e. creating user interface designs and user experience optimization.
 """
-import os
-from pathlib import Path
+import string
 from typing import Optional
-from strands.models import BedrockModel
-from strands import Agent, tool
-from strands_tools import file_read, file_write
+from strands import tool
 from constants import MODEL_UI_DESIGNER
-from project_utils import update_agent_staging_readme, update_project_readme_with_agent_work
-from context_manager import get_condensed_context
+from project_utils import update_readmes_in_background
+from tools._agent_factory import make_agent_tool
+from tools._common import SCRIPT_DIR, format_optional_fields
 
-# Define the tools we need
-tools = [file_read, file_write]
-
-os.environ["BYPASS_TOOL_CONSENT"] = "true"
+# Agent request template. The fixed instructions come first and the per-request
+# fields last, so requests share the longest possible identical prefix.
+_INPUT_TEMPLATE = string.Template("""
+UI/UX DESIGN REQUEST:
 
-# Script directory for relative paths
-script_dir = Path(__file__).parent
+INSTRUCTIONS:
+1. Create design files in assets/designs/ folder
+2. Also create copies in staging/ui_designer/ folder for traceability
+3. Generate whatever files you think are necessary (e.g., wireframes.md, design_system.md, etc.)
+4. Each file should contain detailed, well-structured content
+5. Return a JSON response with the primary file locations (not staging paths) using the following format:
 
+{
+  "status": "completed",
+  "summary": "Brief summary of the UI/UX design work completed",
+  "generated_files": [
+    {
+      "file_path": "assets/designs/filename.md",
+      "file_name": "filename.md", 
+      "content_description": "Description of what this file contains",
+      "key_insights": ["List", "of", "key", "design", "decisions"]
+    }
+  ],
+  "recommendations": ["Key", "design", "recommendations"]
+}
 
-def ui_designer_work(input_text: str, complexity_level: str = "SIMPLE") -> str:
-    """
-    UI designer work function that processes input text and returns the agent's response.
+Expected deliverables:
+- Wireframes and user flow diagrams (assets/designs/)
+- High-fidelity mockups and prototypes (assets/designs/)
+- Design system and style guide (assets/designs/)
+- Component library and UI patterns (assets/designs/)
+- Responsive design specifications (assets/designs/)
+- Accessibility guidelines and compliance checklist (assets/designs/)
+- Interaction design and micro-animations (assets/designs/)
+- User testing recommendations (assets/designs/)
 
-    Args:
-        input_text (str): The input text containing UI/UX requirements or specifications
-        complexity_level (str): Project complexity level (SIMPLE, MODERATE, COMPLEX)
+Project Path: $project_path
+Primary Output: $project_path/assets/designs/
+Staging Folder: $project_path/staging/ui_designer/
 
-    Returns:
-        str: The agent's response including design recommendations and UI specifications
-    """
-    try:
-        # Get context based on complexity level
-        system_prompt = get_condensed_context("ui_designer", complexity_level)
+User Requirements: $user_requirements
+$optional_fields
+""")
 
-        # Agent will be created dynamically based on complexity level
 
-        bedrock_model = BedrockModel(
-            model_id=MODEL_UI_DESIGNER,
-            temperature=0.2,
-            top_p=0.8
-        )
-        # Create agent with appropriate context
-        agent = Agent(model=bedrock_model,
-                      system_prompt=system_prompt, tools=tools)
-
-        response = agent(input_text)
-        return response
-    except ValueError as e:
-        return f"Input value error in UI designer tool: {str(e)}"
-    except RuntimeError as e:
-        return f"Runtime error in UI designer tool: {str(e)}"
-    except ImportError as e:
-        return f"Import error in UI designer tool: {str(e)}"
-    except Exception as e:
-        return f"An unexpected error occurred in UI designer tool: {str(e)}"
+# Agent construction, response caching, streaming and error handling are
+# shared by all worker roles
+_agent_tool = make_agent_tool("ui_designer", MODEL_UI_DESIGNER, "UI designer tool")
+ui_designer_work = _agent_tool.work
+ui_designer_work_async = _agent_tool.work_async
+ui_designer_work_stream = _agent_tool.work_stream
 
 
 @tool
@@ -97,65 +101,27 @@ def ui_designer_tool(
     Returns:
         str: JSON response with list of generated files and their descriptions
     """
-    # Construct structured input for the agent
-    input_text = f"""
-UI/UX DESIGN REQUEST:
-
-Project Path: {project_path}
-Primary Output: {project_path}/assets/designs/
-Staging Folder: {project_path}/staging/ui_designer/
-
-User Requirements: {user_requirements}
-
-{f'Project Complexity Level: {complexity_level}' if complexity_level else ''}
-{f'User Personas: {user_personas}' if user_personas else ''}
-{f'Brand Guidelines: {brand_guidelines}' if brand_guidelines else ''}
-{f'Platform Requirements: {platform_requirements}' if platform_requirements else ''}
-{f'Accessibility Requirements: {accessibility_requirements}' if accessibility_requirements else ''}
-{f'Content Structure: {content_structure}' if content_structure else ''}
-{f'Design Constraints: {design_constraints}' if design_constraints else ''}
-
-INSTRUCTIONS:
-1. Create design files in assets/designs/ folder
-2. Also create copies in staging/ui_designer/ folder for traceability
-3. Generate whatever files you think are necessary (e.g., wireframes.md, design_system.md, etc.)
-4. Each file should contain detailed, well-structured content
-5. Return a JSON response with the primary file locations (not staging paths) using the following format:
-
-{{
-  "status": "completed",
-  "summary": "Brief summary of the UI/UX design work completed",
-  "generated_files": [
-    {{
-      "file_path": "assets/designs/filename.md",
-      "file_name": "filename.md", 
-      "content_description": "Description of what this file contains",
-      "key_insights": ["List", "of", "key", "design", "decisions"]
-    }}
-  ],
-  "recommendations": ["Key", "design", "recommendations"]
-}}
-
-Expected deliverables:
-- Wireframes and user flow diagrams (assets/designs/)
-- High-fidelity mockups and prototypes (assets/designs/)
-- Design system and style guide (assets/designs/)
-- Component library and UI patterns (assets/designs/)
-- Responsive design specifications (assets/designs/)
-- Accessibility guidelines and compliance checklist (assets/designs/)
-- Interaction design and micro-animations (assets/designs/)
-- User testing recommendations (assets/designs/)
-"""
+    # Convert to formatted string for the agent
+    input_text = _INPUT_TEMPLATE.substitute(
+        project_path=project_path,
+        user_requirements=user_requirements,
+        optional_fields=format_optional_fields((
+            ("Project Complexity Level", complexity_level),
+            ("User Personas", user_personas),
+            ("Brand Guidelines", brand_guidelines),
+            ("Platform Requirements", platform_requirements),
+            ("Accessibility Requirements", accessibility_requirements),
+            ("Content Structure", content_structure),
+            ("Design Constraints", design_constraints)
+        ))
+    )
 
     # Use provided complexity level or default to SIMPLE
     comp_level = complexity_level if complexity_level else "SIMPLE"
     result = ui_designer_work(input_text.strip(), comp_level)
 
-    # Update staging README with generated file information
-    update_agent_staging_readme(project_path, "ui_designer", result)
-
-    # Update main project README with agent work progress
-    update_project_readme_with_agent_work(project_path, "ui_designer", result)
+    # Update staging and main project READMEs without blocking the caller
+    update_readmes_in_background(project_path, "ui_designer", result)
 
     return result
 
@@ -191,7 +157,7 @@ if __name__ == "__main__":
     try:
         result = ui_designer_tool(
             user_requirements=test_input,
-            project_path=script_dir.parent / "tmp"
+            project_path=SCRIPT_DIR.parent / "tmp"
         )
         print(result)
     except Exception as e:
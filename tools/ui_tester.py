@@ -1,59 +1,65 @@
 """
 Implement a tool which provides the functions of a UI tester, i.e. performing comprehensive web UI testing using Playwright.
 """
-import os
-from pathlib import Path
+import string
 from typing import Optional
-from strands.models import BedrockModel
-from strands import Agent, tool
+from strands import tool
 from constants import MODEL_UI_TESTER
-from strands_tools import file_read, file_write
-from project_utils import update_agent_staging_readme, update_project_readme_with_agent_work
-from context_manager import get_condensed_context
+from project_utils import update_readmes_in_background
+from tools._agent_factory import make_agent_tool
+from tools._common import SCRIPT_DIR, format_optional_fields
 
-# Define the tools we need
-tools = [file_read, file_write]
+# Agent request template. The fixed instructions come first and the per-request
+# fields last, so requests share the longest possible identical prefix.
+_INPUT_TEMPLATE = string.Template("""
+UI TESTING REQUEST:
 
-os.environ["BYPASS_TOOL_CONSENT"] = "true"
+INSTRUCTIONS:
+1. Create test files in src/tests/, documentation in docs/, and test data in assets/data/
+2. Also create copies in staging/ui_tester/ folder for traceability
+3. Generate whatever files you think are necessary (test scripts, reports, documentation, etc.)
+4. Each file should contain well-structured, executable test code and documentation
+5. Return a JSON response with the primary file locations (not staging paths) using the following format:
 
-# Script directory for relative paths
-script_dir = Path(__file__).parent
+{
+  "status": "completed",
+  "summary": "Brief summary of the testing work completed",
+  "generated_files": [
+    {
+      "file_path": "src/tests/filename.py",
+      "file_name": "filename.py", 
+      "content_description": "Description of what this file contains",
+      "key_insights": ["List", "of", "key", "testing", "insights"]
+    }
+  ],
+  "recommendations": ["Key", "testing", "recommendations"]
+}
 
+Expected deliverables:
+- Automated test scripts (Playwright/Selenium) (src/tests/)
+- Test execution reports with pass/fail status (docs/)
+- Bug reports with detailed reproduction steps (docs/)
+- Performance testing results and metrics (docs/)
+- Accessibility compliance audit reports (docs/)
+- Cross-browser compatibility test results (docs/)
+- Screenshots and videos of test executions (assets/data/)
+- Recommendations for test automation improvements (docs/)
 
-def ui_tester_work(input_text: str, complexity_level: str = "SIMPLE") -> str:
-    """
-    UI tester work function that processes input text and returns the agent's response.
+Project Path: $project_path
+Primary Output: $project_path/src/tests/, $project_path/docs/, $project_path/assets/data/
+Staging Folder: $project_path/staging/ui_tester/
 
-    Args:
-        input_text (str): The input text containing testing requirements or specifications
-        complexity_level (str): Project complexity level (SIMPLE, MODERATE, COMPLEX)
+Testing Requirements: $testing_requirements
+$optional_fields
+""")
 
-    Returns:
-        str: The agent's response including test results and recommendations
-    """
-    try:
-        bedrock_model = BedrockModel(
-            model_id=MODEL_UI_TESTER,
-            temperature=0.2,
-            top_p=0.8
-        )
-        # Get context based on complexity level
-        system_prompt = get_condensed_context("ui_tester", complexity_level)
-
-        # Create agent with appropriate context
-        agent = Agent(model=bedrock_model,
-                      system_prompt=system_prompt, tools=tools)
-
-        response = agent(input_text)
-        return response
-    except ValueError as e:
-        return f"Input value error in UI tester tool: {str(e)}"
-    except RuntimeError as e:
-        return f"Runtime error in UI tester tool: {str(e)}"
-    except ImportError as e:
-        return f"Import error in UI tester tool: {str(e)}"
-    except Exception as e:
-        return f"An unexpected error occurred in UI tester tool: {str(e)}"
+
+# Agent construction, response caching, streaming and error handling are
+# shared by all worker roles
+_agent_tool = make_agent_tool("ui_tester", MODEL_UI_TESTER, "UI tester tool")
+ui_tester_work = _agent_tool.work
+ui_tester_work_async = _agent_tool.work_async
+ui_tester_work_stream = _agent_tool.work_stream
 
 
 @tool
@@ -95,65 +101,27 @@ def ui_tester_tool(
     Returns:
         str: JSON response with list of generated files and their descriptions
     """
-    # Construct structured input for the agent
-    input_text = f"""
-UI TESTING REQUEST:
-
-Project Path: {project_path}
-Primary Output: {project_path}/src/tests/, {project_path}/docs/, {project_path}/assets/data/
-Staging Folder: {project_path}/staging/ui_tester/
-
-Testing Requirements: {testing_requirements}
-
-{f'Project Complexity Level: {complexity_level}' if complexity_level else ''}
-{f'Application URLs: {application_urls}' if application_urls else ''}
-{f'Test Scenarios: {test_scenarios}' if test_scenarios else ''}
-{f'Browser Requirements: {browser_requirements}' if browser_requirements else ''}
-{f'Performance Benchmarks: {performance_benchmarks}' if performance_benchmarks else ''}
-{f'Accessibility Standards: {accessibility_standards}' if accessibility_standards else ''}
-{f'Test Data: {test_data}' if test_data else ''}
-
-INSTRUCTIONS:
-1. Create test files in src/tests/, documentation in docs/, and test data in assets/data/
-2. Also create copies in staging/ui_tester/ folder for traceability
-3. Generate whatever files you think are necessary (test scripts, reports, documentation, etc.)
-4. Each file should contain well-structured, executable test code and documentation
-5. Return a JSON response with the primary file locations (not staging paths) using the following format:
-
-{{
-  "status": "completed",
-  "summary": "Brief summary of the testing work completed",
-  "generated_files": [
-    {{
-      "file_path": "src/tests/filename.py",
-      "file_name": "filename.py", 
-      "content_description": "Description of what this file contains",
-      "key_insights": ["List", "of", "key", "testing", "insights"]
-    }}
-  ],
-  "recommendations": ["Key", "testing", "recommendations"]
-}}
-
-Expected deliverables:
-- Automated test scripts (Playwright/Selenium) (src/tests/)
-- Test execution reports with pass/fail status (docs/)
-- Bug reports with detailed reproduction steps (docs/)
-- Performance testing results and metrics (docs/)
-- Accessibility compliance audit reports (docs/)
-- Cross-browser compatibility test results (docs/)
-- Screenshots and videos of test executions (assets/data/)
-- Recommendations for test automation improvements (docs/)
-"""
+    # Convert to formatted string for the agent
+    input_text = _INPUT_TEMPLATE.substitute(
+        project_path=project_path,
+        testing_requirements=testing_requirements,
+        optional_fields=format_optional_fields((
+            ("Project Complexity Level", complexity_level),
+            ("Application URLs", application_urls),
+            ("Test Scenarios", test_scenarios),
+            ("Browser Requirements", browser_requirements),
+            ("Performance Benchmarks", performance_benchmarks),
+            ("Accessibility Standards", accessibility_standards),
+            ("Test Data", test_data)
+        ))
+    )
 
     # Use provided complexity level or default to SIMPLE
     comp_level = complexity_level if complexity_level else "SIMPLE"
     result = ui_tester_work(input_text.strip(), comp_level)
 
-    # Update staging README with generated file information
-    update_agent_staging_readme(project_path, "ui_tester", result)
-
-    # Update main project README with agent work progress
-    update_project_readme_with_agent_work(project_path, "ui_tester", result)
+    # Update staging and main project READMEs without blocking the caller
+    update_readmes_in_background(project_path, "ui_tester", result)
 
     return result
 
@@ -202,7 +170,7 @@ if __name__ == "__main__":
     try:
         result = ui_tester_tool(
             testing_requirements=test_input,
-            project_path=script_dir.parent / "tmp"
+            project_path=SCRIPT_DIR.parent / "tmp"
         )
         print(result)
     except Exception as e: